@@ -26,13 +26,8 @@ $ErrorActionPreference = "Stop"
 $ProjectRoot = Split-Path -Parent $MyInvocation.MyCommand.Path
 $BuildDir = Join-Path $ProjectRoot "build"
 
-function Test-SubmoduleMissingRecursive([string]$Path) {
-    $status = git submodule status --recursive $Path 2>$null
-    foreach ($line in $status) {
-        if ($line.StartsWith("-")) { return $true }
-    }
-    return $false
-}
+# $NumCores, $GitCheckout, Test-SubmoduleMissingRecursive, Stop-NotACheckout
+. (Join-Path $ProjectRoot "source\scripts\submodule-helpers.ps1")
 
 function Ensure-SubmoduleForBuild {
     param(
@@ -41,16 +36,23 @@ function Ensure-SubmoduleForBuild {
         [switch]$Recursive
     )
 
+    # init.ps1 has just verified every submodule — skip the git round-trips.
+    if (($env:SPATIALROOT_SUBMODULES_READY -eq "1") -and (Test-Path $Sentinel)) {
+        return
+    }
+
     if ((Test-Path $Sentinel) -and -not (Test-SubmoduleMissingRecursive $Path)) {
         return
     }
 
+    if (-not $GitCheckout) { Stop-NotACheckout $Path $Sentinel }
+
     Write-Host "Initializing required submodule: $Path"
     git submodule sync --recursive $Path
     if ($Recursive) {
-        git submodule update --init --recursive --depth 1 --checkout $Path
+        git submodule update --init --recursive --depth 1 --jobs $NumCores --checkout $Path
     } else {
-        git submodule update --init --depth 1 --checkout $Path
+        git submodule update --init --depth 1 --jobs $NumCores --checkout $Path
     }
     if ($LASTEXITCODE -ne 0) {
         Write-Host "✗ Failed to initialize $Path" -ForegroundColor Red
@@ -81,7 +83,25 @@ if ($BuildGUI -eq "ON") {
     Ensure-SubmoduleForBuild -Path "thirdparty/glfw" -Sentinel (Join-Path $ProjectRoot "thirdparty\glfw\CMakeLists.txt")
 }
 
-$NumCores = [Environment]::ProcessorCount
+# ── Generator ─────────────────────────────────────────────────────────────────
+# Prefer Ninja when it is installed and MSVC is on PATH (Developer PowerShell):
+# faster to configure and build than the Visual Studio generator. An existing
+# build\ configured with another generator is left alone (CMake refuses to
+# switch generators in place), as is an explicit CMAKE_GENERATOR.
+$GeneratorArgs = @()
+$GeneratorName = "default"
+$CacheFile = Join-Path $BuildDir "CMakeCache.txt"
+if ($env:CMAKE_GENERATOR) {
+    $GeneratorName = $env:CMAKE_GENERATOR
+} elseif (Test-Path $CacheFile) {
+    $cached = Select-String -Path $CacheFile -Pattern '^CMAKE_GENERATOR:INTERNAL=(.*)$' | Select-Object -First 1
+    if ($cached) { $GeneratorName = $cached.Matches[0].Groups[1].Value }
+} elseif ((Get-Command ninja -ErrorAction SilentlyContinue) -and (Get-Command cl -ErrorAction SilentlyContinue)) {
+    $GeneratorArgs = @("-G", "Ninja")
+    $GeneratorName = "Ninja"
+}
+# Multi-config generators (Visual Studio) place binaries under Release\
+$ConfigSubdir = if ($GeneratorName -eq "Ninja") { "" } else { "Release\" }
 
 Write-Host "============================================================"
 Write-Host "spatialroot build (Windows)"
@@ -90,6 +110,7 @@ Write-Host "  Offline  (spatialroot_spatial_render) : $BuildOffline"
 Write-Host "  CULT     (cult-transcoder)            : $BuildCult"
 Write-Host "  GUI      (ImGui + GLFW desktop app)   : $BuildGUI"
 Write-Host "  Cores                                 : $NumCores"
+Write-Host "  Generator                             : $GeneratorName"
 Write-Host "============================================================"
 Write-Host ""
 
@@ -97,29 +118,72 @@ if (-not (Test-Path $BuildDir)) {
     New-Item -ItemType Directory -Path $BuildDir | Out-Null
 }
 
-Write-Host "Configuring CMake..."
-cmake `
-    -B $BuildDir `
-    -DCMAKE_BUILD_TYPE=Release `
-    "-DSPATIALROOT_BUILD_ENGINE=$BuildEngine" `
-    "-DSPATIALROOT_BUILD_OFFLINE=$BuildOffline" `
-    "-DSPATIALROOT_BUILD_CULT=$BuildCult" `
-    "-DSPATIALROOT_BUILD_GUI=$BuildGUI" `
-    "-DSPATIALROOT_BUILD_DEVTOOLS=$BuildDevtools" `
-    $ProjectRoot
-
-if ($LASTEXITCODE -ne 0) {
-    Write-Host "✗ CMake configure failed" -ForegroundColor Red
-    exit $LASTEXITCODE
+# ── Configure (skipped when the cache already matches) ───────────────────────
+$CMakeOptions = [ordered]@{
+    CMAKE_BUILD_TYPE           = "Release"
+    SPATIALROOT_BUILD_ENGINE   = $BuildEngine
+    SPATIALROOT_BUILD_OFFLINE  = $BuildOffline
+    SPATIALROOT_BUILD_CULT     = $BuildCult
+    SPATIALROOT_BUILD_GUI      = $BuildGUI
+    SPATIALROOT_BUILD_DEVTOOLS = $BuildDevtools
 }
 
-Write-Host ""
-Write-Host "Building ($NumCores cores)..."
-cmake --build $BuildDir --parallel $NumCores --config Release
+# True when build\ finished a configure+generate (cmake.check_cache) with
+# exactly these option values. Edits to CMakeLists.txt are still picked up:
+# `cmake --build` re-runs configure itself when any listfile changed.
+function Test-CacheMatchesOptions {
+    if (-not (Test-Path $CacheFile) -or
+        -not (Test-Path (Join-Path $BuildDir "CMakeFiles\cmake.check_cache"))) {
+        return $false
+    }
+    $cached = @{}
+    foreach ($line in [System.IO.File]::ReadLines($CacheFile)) {
+        if ($line -match '^([A-Za-z0-9_]+):[A-Z]+=(.*)$') { $cached[$Matches[1]] = $Matches[2] }
+    }
+    foreach ($key in $CMakeOptions.Keys) {
+        if ($cached[$key] -ne $CMakeOptions[$key]) { return $false }
+    }
+    return $true
+}
+
+# Nested builds (FetchContent / ExternalProject sub-builds) read this instead
+# of inheriting --parallel from the top-level cmake --build.
+$SavedParallelLevel = $env:CMAKE_BUILD_PARALLEL_LEVEL
+$env:CMAKE_BUILD_PARALLEL_LEVEL = "$NumCores"
+
+# Submodules were checked above, so CMake only needs its sentinel checks. Read
+# from the environment, so it applies only to configures run by this script.
+$SavedSkipGitCheck = $env:SPATIALROOT_SKIP_SUBMODULE_GIT_CHECK
+$env:SPATIALROOT_SKIP_SUBMODULE_GIT_CHECK = "1"
+
+try {
+    if (Test-CacheMatchesOptions) {
+        Write-Host "✓ CMake cache up to date — skipping configure"
+    } else {
+        $CMakeDefines = @($CMakeOptions.GetEnumerator() | ForEach-Object { "-D$($_.Key)=$($_.Value)" })
+
+        Write-Host "Configuring CMake..."
+        cmake -B $BuildDir @GeneratorArgs @CMakeDefines $ProjectRoot
 
-if ($LASTEXITCODE -ne 0) {
-    Write-Host "✗ Build failed" -ForegroundColor Red
-    exit $LASTEXITCODE
+        if ($LASTEXITCODE -ne 0) {
+            Write-Host "✗ CMake configure failed" -ForegroundColor Red
+            exit $LASTEXITCODE
+        }
+    }
+
+    Write-Host ""
+    Write-Host "Building ($NumCores cores)..."
+    cmake --build $BuildDir --parallel $NumCores --config Release
+
+    if ($LASTEXITCODE -ne 0) {
+        Write-Host "✗ Build failed" -ForegroundColor Red
+        exit $LASTEXITCODE
+    }
+} finally {
+    # The script runs in the caller's session: put both variables back so they
+    # don't pin later builds there. Assigning $null removes one that was unset.
+    $env:CMAKE_BUILD_PARALLEL_LEVEL = $SavedParallelLevel
+    $env:SPATIALROOT_SKIP_SUBMODULE_GIT_CHECK = $SavedSkipGitCheck
 }
 
 Write-Host ""
@@ -127,16 +191,16 @@ Write-Host "============================================================"
 Write-Host "✓ Build complete!"
 Write-Host ""
 if ($BuildEngine -eq "ON") {
-    Write-Host "  spatialroot_realtime       : $BuildDir\source\spatial_engine\realtimeEngine\Release\spatialroot_realtime.exe"
+    Write-Host "  spatialroot_realtime       : $BuildDir\source\spatial_engine\realtimeEngine\${ConfigSubdir}spatialroot_realtime.exe"
 }
 if ($BuildOffline -eq "ON") {
-    Write-Host "  spatialroot_spatial_render : $BuildDir\source\spatial_engine\spatialRender\Release\spatialroot_spatial_render.exe"
+    Write-Host "  spatialroot_spatial_render : $BuildDir\source\spatial_engine\spatialRender\${ConfigSubdir}spatialroot_spatial_render.exe"
 }
 if ($BuildCult -eq "ON") {
-    Write-Host "  cult-transcoder            : $BuildDir\internal\cult_transcoder\Release\cult-transcoder.exe"
+    Write-Host "  cult-transcoder            : $BuildDir\internal\cult_transcoder\${ConfigSubdir}cult-transcoder.exe"
 }
 if ($BuildGUI -eq "ON") {
-    Write-Host "  spatialroot_gui            : $BuildDir\source\gui\imgui\Release\Spatial Root.exe"
+    Write-Host "  spatialroot_gui            : $BuildDir\source\gui\imgui\${ConfigSubdir}Spatial Root.exe"
 }
 Write-Host "============================================================"
 Write-Host ""
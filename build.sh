@@ -18,26 +18,31 @@ set -e
 PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 BUILD_DIR="${PROJECT_ROOT}/build"
 
-submodule_has_missing_recursive() {
-    local path="$1"
-    git submodule status --recursive "$path" 2>/dev/null | grep -q '^-'
-}
+# NUM_CORES, GIT_CHECKOUT, submodule_has_missing_recursive, not_a_checkout_error
+source "${PROJECT_ROOT}/source/scripts/submodule-helpers.sh"
 
 ensure_submodule_for_build() {
     local path="$1"
     local sentinel="$2"
     local recursive="${3:-no}"
 
+    # init.sh has just verified every submodule — skip the git round-trips.
+    if [ "${SPATIALROOT_SUBMODULES_READY:-0}" = "1" ] && [ -e "$sentinel" ]; then
+        return
+    fi
+
     if [ -e "$sentinel" ] && ! submodule_has_missing_recursive "$path"; then
         return
     fi
 
+    [ "${GIT_CHECKOUT}" = "1" ] || not_a_checkout_error "$path" "$sentinel"
+
     echo "Initializing required submodule: $path"
     git submodule sync --recursive "$path"
     if [ "$recursive" = "yes" ]; then
-        git submodule update --init --recursive --depth 1 --checkout "$path"
+        git submodule update --init --recursive --depth 1 --jobs "${NUM_CORES}" --checkout "$path"
     else
-        git submodule update --init --depth 1 --checkout "$path"
+        git submodule update --init --depth 1 --jobs "${NUM_CORES}" --checkout "$path"
     fi
 }
 
@@ -77,6 +82,15 @@ for arg in "$@"; do
     esac
 done
 
+# ── Build parallelism ─────────────────────────────────────────────────────────
+# Nested builds (FetchContent / ExternalProject sub-builds) read this instead
+# of inheriting --parallel from the top-level cmake --build.
+export CMAKE_BUILD_PARALLEL_LEVEL="${NUM_CORES}"
+
+# Submodules are checked below, so CMake only needs its sentinel checks. Read
+# from the environment, so it applies only to configures run by this script.
+export SPATIALROOT_SKIP_SUBMODULE_GIT_CHECK=1
+
 # ── Submodule bootstrap for fresh clones / moved paths ───────────────────────
 ensure_submodule_for_build "internal/cult-allolib" "${PROJECT_ROOT}/internal/cult-allolib/include" "yes"
 ensure_submodule_for_build "thirdparty/libsndfile" "${PROJECT_ROOT}/thirdparty/libsndfile/CMakeLists.txt"
@@ -90,13 +104,20 @@ if [ "${BUILD_GUI}" = "ON" ]; then
     ensure_submodule_for_build "thirdparty/glfw" "${PROJECT_ROOT}/thirdparty/glfw/CMakeLists.txt"
 fi
 
-# ── CPU count ─────────────────────────────────────────────────────────────────
-if command -v nproc &>/dev/null; then
-    NUM_CORES=$(nproc)
-elif command -v sysctl &>/dev/null; then
-    NUM_CORES=$(sysctl -n hw.logicalcpu)
-else
-    NUM_CORES=4
+# ── Generator ─────────────────────────────────────────────────────────────────
+# Prefer Ninja when it is installed: faster to configure and keeps more cores
+# busy than Unix Makefiles. An existing build/ configured with another
+# generator is left alone (CMake refuses to switch generators in place), as is
+# an explicit CMAKE_GENERATOR from the environment.
+GENERATOR_ARGS=()
+GENERATOR_NAME="default"
+if [ -n "${CMAKE_GENERATOR:-}" ]; then
+    GENERATOR_NAME="${CMAKE_GENERATOR}"
+elif [ -f "${BUILD_DIR}/CMakeCache.txt" ]; then
+    GENERATOR_NAME="$(sed -n 's/^CMAKE_GENERATOR:INTERNAL=//p' "${BUILD_DIR}/CMakeCache.txt")"
+elif command -v ninja &>/dev/null; then
+    GENERATOR_ARGS=(-G Ninja)
+    GENERATOR_NAME="Ninja"
 fi
 
 echo "============================================================"
@@ -106,21 +127,58 @@ echo "  Offline  (spatialroot_spatial_render) : ${BUILD_OFFLINE}"
 echo "  CULT     (cult-transcoder)            : ${BUILD_CULT}"
 echo "  GUI      (spatialroot_gui ImGui+GLFW) : ${BUILD_GUI}"
 echo "  Cores                                 : ${NUM_CORES}"
+echo "  Generator                             : ${GENERATOR_NAME:-default}"
 echo "============================================================"
 echo ""
 
 mkdir -p "${BUILD_DIR}"
 
-echo "Configuring CMake..."
-cmake \
-    -B "${BUILD_DIR}" \
-    -DCMAKE_BUILD_TYPE=Release \
-    -DSPATIALROOT_BUILD_ENGINE="${BUILD_ENGINE}" \
-    -DSPATIALROOT_BUILD_OFFLINE="${BUILD_OFFLINE}" \
-    -DSPATIALROOT_BUILD_CULT="${BUILD_CULT}" \
-    -DSPATIALROOT_BUILD_GUI="${BUILD_GUI}" \
-    -DSPATIALROOT_BUILD_DEVTOOLS="${BUILD_DEVTOOLS}" \
-    "${PROJECT_ROOT}"
+# ── Configure (skipped when the cache already matches) ───────────────────────
+CMAKE_OPTIONS=(
+    "CMAKE_BUILD_TYPE=Release"
+    "SPATIALROOT_BUILD_ENGINE=${BUILD_ENGINE}"
+    "SPATIALROOT_BUILD_OFFLINE=${BUILD_OFFLINE}"
+    "SPATIALROOT_BUILD_CULT=${BUILD_CULT}"
+    "SPATIALROOT_BUILD_GUI=${BUILD_GUI}"
+    "SPATIALROOT_BUILD_DEVTOOLS=${BUILD_DEVTOOLS}"
+)
+
+# True when build/ finished a configure+generate (cmake.check_cache) with
+# exactly these option values. Edits to CMakeLists.txt are still picked up:
+# `cmake --build` re-runs configure itself when any listfile changed.
+cache_matches_options() {
+    local cache="${BUILD_DIR}/CMakeCache.txt"
+    [ -f "${cache}" ] && [ -f "${BUILD_DIR}/CMakeFiles/cmake.check_cache" ] || return 1
+    awk -v opts="${CMAKE_OPTIONS[*]}" '
+        BEGIN {
+            n = split(opts, want, " ")
+            for (i = 1; i <= n; i++) {
+                eq = index(want[i], "=")
+                need[substr(want[i], 1, eq - 1)] = substr(want[i], eq + 1)
+            }
+        }
+        {
+            key = $0; sub(/:.*/, "", key)
+            if ((key in need) && need[key] == substr($0, index($0, "=") + 1)) delete need[key]
+        }
+        END { for (k in need) exit 1 }' "${cache}"
+}
+
+if cache_matches_options; then
+    echo "✓ CMake cache up to date — skipping configure"
+else
+    CMAKE_DEFINES=()
+    for opt in "${CMAKE_OPTIONS[@]}"; do
+        CMAKE_DEFINES+=("-D${opt}")
+    done
+
+    echo "Configuring CMake..."
+    cmake \
+        -B "${BUILD_DIR}" \
+        "${GENERATOR_ARGS[@]}" \
+        "${CMAKE_DEFINES[@]}" \
+        "${PROJECT_ROOT}"
+fi
 
 echo ""
 echo "Building (${NUM_CORES} cores)..."
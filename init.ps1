@@ -6,11 +6,13 @@
 # Usage:
 #   Set-ExecutionPolicy -Scope Process Bypass
 #   .\init.ps1
+#   .\init.ps1 -Force   # Re-check submodules and rebuild even if already built
 #
 # No Python toolchain required.
 
 [CmdletBinding()]
 param(
+    [switch]$Force,
     [switch]$Help
 )
 
@@ -19,13 +21,15 @@ $ErrorActionPreference = "Stop"
 $ProjectRoot = Split-Path -Parent $MyInvocation.MyCommand.Path
 Set-Location $ProjectRoot
 
-function Test-SubmoduleMissingRecursive([string]$Path) {
-    $status = git submodule status --recursive $Path 2>$null
-    foreach ($line in $status) {
-        if ($line.StartsWith("-")) { return $true }
-    }
-    return $false
-}
+# $NumCores, $GitCheckout, Test-SubmoduleMissingRecursive, Stop-NotACheckout
+. (Join-Path $ProjectRoot "source\scripts\submodule-helpers.ps1")
+
+# Steps 2–7 only check submodules and queue the missing ones; Invoke-SubmoduleFetch
+# then syncs and updates the whole queue in one git call per kind (flat /
+# recursive), so --jobs can overlap the clones.
+$PendingFlat      = [System.Collections.Generic.List[string]]::new()
+$PendingRecursive = [System.Collections.Generic.List[string]]::new()
+$PendingSentinels = [System.Collections.Generic.List[string]]::new()
 
 function Ensure-Submodule {
     param(
@@ -39,25 +43,87 @@ function Ensure-Submodule {
         return
     }
 
-    Write-Host "Fetching $Path..."
-    git submodule sync --recursive $Path
-    if ($Recursive) {
-        git submodule update --init --recursive --depth 1 --checkout $Path
-    } else {
-        git submodule update --init --depth 1 --checkout $Path
+    if (-not $GitCheckout) { Stop-NotACheckout $Path $Sentinel }
+
+    Write-Host "→ $Path queued for fetch"
+    if ($Recursive) { $PendingRecursive.Add($Path) } else { $PendingFlat.Add($Path) }
+    $PendingSentinels.Add($Sentinel)
+}
+
+function Invoke-SubmoduleFetch {
+    $all = @($PendingFlat) + @($PendingRecursive)
+    if ($all.Count -eq 0) {
+        Write-Host "✓ All submodules already initialized"
+        return
     }
-    if ($LASTEXITCODE -ne 0) {
-        Write-Host "✗ Failed to initialize $Path" -ForegroundColor Red
-        exit 1
+
+    Write-Host "Fetching $($all -join ' ')..."
+    git submodule sync --recursive @all
+    if ($PendingFlat.Count -gt 0) {
+        git submodule update --init --depth 1 --jobs $NumCores --checkout @PendingFlat
+        if ($LASTEXITCODE -ne 0) {
+            Write-Host "✗ Failed to initialize $($PendingFlat -join ' ')" -ForegroundColor Red
+            exit 1
+        }
     }
-    Write-Host "✓ $Path initialized"
+    if ($PendingRecursive.Count -gt 0) {
+        git submodule update --init --recursive --depth 1 --jobs $NumCores --checkout @PendingRecursive
+        if ($LASTEXITCODE -ne 0) {
+            Write-Host "✗ Failed to initialize $($PendingRecursive -join ' ')" -ForegroundColor Red
+            exit 1
+        }
+    }
+    foreach ($sentinel in $PendingSentinels) {
+        if (-not (Test-Path $sentinel)) {
+            Write-Host "✗ Submodule fetch finished but $sentinel is missing." -ForegroundColor Red
+            exit 1
+        }
+    }
+    Write-Host "✓ $($all -join ' ') initialized"
 }
 
 if ($Help) {
-    Write-Host "Usage: .\init.ps1"
+    Write-Host "Usage: .\init.ps1 [-Force]"
     Write-Host ""
     Write-Host "Initializes git submodules and builds all C++ components."
     Write-Host "Run once after cloning. Subsequent builds: .\build.ps1"
+    Write-Host ""
+    Write-Host "A bare .\init.ps1 exits early when a previous init finished and all"
+    Write-Host "binaries exist."
+    Write-Host ""
+    Write-Host "  -Force   Re-check submodules and rebuild even if all binaries exist"
+    exit 0
+}
+
+# ── Fast path: already initialized and built ─────────────────────────────────
+# Re-running init.ps1 on a finished checkout should not re-walk every submodule
+# and re-enter the build. Use -Force (or .\build.ps1) to rebuild. Only a bare
+# .\init.ps1 takes it, so any switch added here still reaches the build.
+# The stamp is written after a successful init; a .gitmodules edited since then
+# (new or moved submodule) invalidates it.
+$InitStamp = Join-Path $ProjectRoot "build\.spatialroot_init_ok"
+function Test-InitStamp {
+    if (-not (Test-Path $InitStamp)) { return $false }
+    $gitmodules = Join-Path $ProjectRoot ".gitmodules"
+    if (-not (Test-Path $gitmodules)) { return $true }
+    return (Get-Item $InitStamp).LastWriteTimeUtc -gt (Get-Item $gitmodules).LastWriteTimeUtc
+}
+# Returns the binary's path relative to the project root, or $null if missing.
+function Get-BuiltBinary([string]$Dir, [string]$Name) {
+    # Visual Studio generators add a Release\ level; Ninja does not.
+    foreach ($rel in "build\$Dir\Release\$Name", "build\$Dir\$Name") {
+        if (Test-Path (Join-Path $ProjectRoot $rel)) { return $rel }
+    }
+    return $null
+}
+if ($PSBoundParameters.Count -eq 0 -and
+    (Test-InitStamp) -and
+    (Get-BuiltBinary "source\spatial_engine\realtimeEngine" "spatialroot_realtime.exe") -and
+    (Get-BuiltBinary "source\spatial_engine\spatialRender" "spatialroot_spatial_render.exe") -and
+    (Get-BuiltBinary "internal\cult_transcoder" "cult-transcoder.exe") -and
+    (Get-BuiltBinary "source\gui\imgui" "Spatial Root.exe")) {
+    Write-Host "✓ spatialroot is already initialized and built — nothing to do."
+    Write-Host "  Rebuild with .\build.ps1, or re-run .\init.ps1 -Force"
     exit 0
 }
 
@@ -81,11 +147,21 @@ if (-not (Get-Command cmake -ErrorAction SilentlyContinue)) {
 $cmakeVersion = (cmake --version | Select-Object -First 1).Split(" ")[2]
 Write-Host "✓ cmake $cmakeVersion found"
 
-if (-not (Get-Command git -ErrorAction SilentlyContinue)) {
+# Optional: build.ps1 configures with Ninja when ninja and cl are both on PATH.
+if (Get-Command ninja -ErrorAction SilentlyContinue) {
+    Write-Host "✓ ninja found (used when run from a VS Developer shell)"
+} else {
+    Write-Host "ℹ  ninja not found — building with the Visual Studio generator"
+}
+
+if (-not $GitCheckout) {
+    Write-Host "ℹ  Not a git checkout — submodules must already be present"
+} elseif (-not (Get-Command git -ErrorAction SilentlyContinue)) {
     Write-Host "✗ git not found. Install Git for Windows." -ForegroundColor Red
     exit 1
+} else {
+    Write-Host "✓ git found"
 }
-Write-Host "✓ git found"
 
 $vswhere = "${env:ProgramFiles(x86)}\Microsoft Visual Studio\Installer\vswhere.exe"
 if (Test-Path $vswhere) {
@@ -108,27 +184,27 @@ if (Test-Path $vswhere) {
 Write-Host ""
 
 # ── Step 2: Initialize LUSID submodule ───────────────────────────────────────
-Write-Host "Step 2: Initializing LUSID submodule..."
+Write-Host "Step 2: Checking LUSID submodule..."
 Ensure-Submodule -Path "internal/LUSID" -Sentinel (Join-Path $ProjectRoot "internal\LUSID\README.md")
 Write-Host ""
 
 # ── Step 3: Initialize cult-allolib submodule ────────────────────────────────
-Write-Host "Step 3: Initializing cult-allolib submodule..."
+Write-Host "Step 3: Checking cult-allolib submodule..."
 Ensure-Submodule -Path "internal/cult-allolib" -Sentinel (Join-Path $ProjectRoot "internal\cult-allolib\include") -Recursive
 Write-Host ""
 
 # ── Step 4: Initialize cult_transcoder submodule ─────────────────────────────
-Write-Host "Step 4: Initializing cult_transcoder submodule..."
+Write-Host "Step 4: Checking cult_transcoder submodule..."
 Ensure-Submodule -Path "internal/cult_transcoder" -Sentinel (Join-Path $ProjectRoot "internal\cult_transcoder\thirdparty\libbw64\include\bw64\bw64.hpp") -Recursive
 Write-Host ""
 
 # ── Step 5: Initialize libsndfile submodule ──────────────────────────────────
-Write-Host "Step 5: Initializing libsndfile submodule..."
+Write-Host "Step 5: Checking libsndfile submodule..."
 Ensure-Submodule -Path "thirdparty/libsndfile" -Sentinel (Join-Path $ProjectRoot "thirdparty\libsndfile\CMakeLists.txt")
 Write-Host ""
 
 # ── Step 6: Initialize Dear ImGui submodule (optional — needed for GUI build) ─
-Write-Host "Step 6: Initializing Dear ImGui submodule..."
+Write-Host "Step 6: Checking Dear ImGui submodule..."
 
 $GitmodulesPath = Join-Path $ProjectRoot ".gitmodules"
 $ImGuiDir = Join-Path $ProjectRoot "thirdparty\imgui"
@@ -140,7 +216,7 @@ if ((Test-Path $GitmodulesPath) -and (Select-String -Path $GitmodulesPath -Patte
 Write-Host ""
 
 # ── Step 7: Initialize GLFW submodule (optional — needed for GUI build) ──────
-Write-Host "Step 7: Initializing GLFW submodule..."
+Write-Host "Step 7: Checking GLFW submodule..."
 
 $GlfwDir = Join-Path $ProjectRoot "thirdparty\glfw"
 if ((Test-Path $GitmodulesPath) -and (Select-String -Path $GitmodulesPath -Pattern "thirdparty/glfw" -Quiet)) {
@@ -150,26 +226,34 @@ if ((Test-Path $GitmodulesPath) -and (Select-String -Path $GitmodulesPath -Patte
 }
 Write-Host ""
 
+# ── Fetch queued submodules ───────────────────────────────────────────────────
+Invoke-SubmoduleFetch
+Write-Host ""
+
 # ── Step 8: Build all C++ components ─────────────────────────────────────────
 Write-Host "Step 8: Building all C++ components..."
 Write-Host ""
 
 $buildScript = Join-Path $ProjectRoot "build.ps1"
+# Submodules were verified above; tell build.ps1 not to re-check them.
+$env:SPATIALROOT_SUBMODULES_READY = "1"
 & $buildScript -GuiBuild
+Remove-Item Env:SPATIALROOT_SUBMODULES_READY -ErrorAction SilentlyContinue
 
 if ($LASTEXITCODE -ne 0) {
     Write-Host "✗ Build failed. Check CMake output above." -ForegroundColor Red
     exit 1
 }
+New-Item -ItemType File -Path $InitStamp -Force | Out-Null
 
 Write-Host ""
 Section "✓ Initialization complete!"
 
 Write-Host "Binaries:"
-Write-Host "  spatialroot_realtime       : build\source\spatial_engine\realtimeEngine\Release\spatialroot_realtime.exe"
-Write-Host "  spatialroot_spatial_render : build\source\spatial_engine\spatialRender\Release\spatialroot_spatial_render.exe"
-Write-Host "  cult-transcoder            : build\internal\cult_transcoder\Release\cult-transcoder.exe"
-Write-Host "  spatialroot_gui            : build\source\gui\imgui\Release\Spatial Root.exe"
+Write-Host "  spatialroot_realtime       : $(Get-BuiltBinary "source\spatial_engine\realtimeEngine" "spatialroot_realtime.exe")"
+Write-Host "  spatialroot_spatial_render : $(Get-BuiltBinary "source\spatial_engine\spatialRender" "spatialroot_spatial_render.exe")"
+Write-Host "  cult-transcoder            : $(Get-BuiltBinary "internal\cult_transcoder" "cult-transcoder.exe")"
+Write-Host "  spatialroot_gui            : $(Get-BuiltBinary "source\gui\imgui" "Spatial Root.exe")"
 Write-Host ""
 Write-Host "For subsequent full builds:"
 Write-Host "  .\build.ps1"
@@ -6,6 +6,7 @@
 #
 # Usage:
 #   ./init.sh          # Initialize deps and build everything
+#   ./init.sh --force  # Re-check submodules and rebuild even if already built
 #   ./init.sh --help   # Show this message
 #
 # No Python toolchain required.
@@ -15,10 +16,16 @@ set -e
 PROJECT_ROOT="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 cd "${PROJECT_ROOT}"
 
-submodule_has_missing_recursive() {
-    local path="$1"
-    git submodule status --recursive "$path" 2>/dev/null | grep -q '^-'
-}
+# NUM_CORES, GIT_CHECKOUT, submodule_has_missing_recursive, not_a_checkout_error
+source "${PROJECT_ROOT}/source/scripts/submodule-helpers.sh"
+
+# Steps 2–7 only check submodules and queue the missing ones; fetch_submodules
+# then syncs and updates the whole queue in one git call per kind (flat /
+# recursive), so --jobs can overlap the clones instead of running them one step
+# at a time.
+PENDING_FLAT=()
+PENDING_RECURSIVE=()
+PENDING_SENTINELS=()
 
 ensure_submodule() {
     local path="$1"
@@ -30,21 +37,82 @@ ensure_submodule() {
         return
     fi
 
-    echo "Fetching $path..."
-    git submodule sync --recursive "$path"
+    [ "${GIT_CHECKOUT}" = "1" ] || not_a_checkout_error "$path" "$sentinel"
+
+    echo "→ $path queued for fetch"
     if [ "$recursive" = "yes" ]; then
-        git submodule update --init --recursive --depth 1 --checkout "$path"
+        PENDING_RECURSIVE+=("$path")
     else
-        git submodule update --init --depth 1 --checkout "$path"
+        PENDING_FLAT+=("$path")
+    fi
+    PENDING_SENTINELS+=("$sentinel")
+}
+
+fetch_submodules() {
+    local all=("${PENDING_FLAT[@]}" "${PENDING_RECURSIVE[@]}")
+    if [ ${#all[@]} -eq 0 ]; then
+        echo "✓ All submodules already initialized"
+        return
+    fi
+
+    echo "Fetching ${all[*]}..."
+    git submodule sync --recursive "${all[@]}"
+    if [ ${#PENDING_FLAT[@]} -gt 0 ]; then
+        git submodule update --init --depth 1 --jobs "${NUM_CORES}" --checkout "${PENDING_FLAT[@]}"
+    fi
+    if [ ${#PENDING_RECURSIVE[@]} -gt 0 ]; then
+        git submodule update --init --recursive --depth 1 --jobs "${NUM_CORES}" --checkout "${PENDING_RECURSIVE[@]}"
     fi
-    echo "✓ $path initialized"
+
+    local sentinel
+    for sentinel in "${PENDING_SENTINELS[@]}"; do
+        if [ ! -e "$sentinel" ]; then
+            echo "✗ Submodule fetch finished but $sentinel is missing."
+            exit 1
+        fi
+    done
+    echo "✓ ${all[*]} initialized"
 }
 
 if [ "${1}" = "--help" ] || [ "${1}" = "-h" ]; then
-    echo "Usage: ./init.sh"
+    echo "Usage: ./init.sh [--force] [build.sh options]"
     echo ""
     echo "Initializes git submodules and builds all C++ components."
     echo "Run once after cloning. Subsequent builds: ./build.sh"
+    echo ""
+    echo "A bare ./init.sh exits early when a previous init finished and all"
+    echo "binaries exist. Any other option (passed on to build.sh) always runs"
+    echo "the full init."
+    echo ""
+    echo "  --force   Re-check submodules and rebuild even if all binaries exist"
+    exit 0
+fi
+
+FORCE_INIT=0
+BUILD_ARGS=()
+for arg in "$@"; do
+    case "$arg" in
+        --force) FORCE_INIT=1 ;;
+        *)       BUILD_ARGS+=("$arg") ;;
+    esac
+done
+
+# ── Fast path: already initialized and built ─────────────────────────────────
+# Re-running init.sh on a finished checkout should not re-walk every submodule
+# and re-enter the build. Use --force (or ./build.sh) to rebuild. Only a bare
+# ./init.sh takes it: options meant for build.sh must reach the build.
+# The stamp is written after a successful init; a .gitmodules edited since then
+# (new or moved submodule) invalidates it.
+INIT_STAMP="${PROJECT_ROOT}/build/.spatialroot_init_ok"
+if [ "${FORCE_INIT}" -eq 0 ] && [ ${#BUILD_ARGS[@]} -eq 0 ] \
+    && [ -f "${INIT_STAMP}" ] \
+    && { [ ! -f "${PROJECT_ROOT}/.gitmodules" ] || [ "${INIT_STAMP}" -nt "${PROJECT_ROOT}/.gitmodules" ]; } \
+    && [ -f "${PROJECT_ROOT}/build/source/spatial_engine/realtimeEngine/spatialroot_realtime" ] \
+    && [ -f "${PROJECT_ROOT}/build/source/spatial_engine/spatialRender/spatialroot_spatial_render" ] \
+    && [ -f "${PROJECT_ROOT}/build/internal/cult_transcoder/cult-transcoder" ] \
+    && [ -f "${PROJECT_ROOT}/build/source/gui/imgui/Spatial Root" ]; then
+    echo "✓ spatialroot is already initialized and built — nothing to do."
+    echo "  Rebuild with ./build.sh, or re-run ./init.sh --force"
     exit 0
 fi
 
@@ -68,11 +136,22 @@ fi
 CMAKE_VERSION=$(cmake --version | head -1 | awk '{print $3}')
 echo "✓ cmake ${CMAKE_VERSION} found"
 
-if ! command -v git &>/dev/null; then
+# Optional: build.sh configures with Ninja when it is on PATH.
+if command -v ninja &>/dev/null; then
+    echo "✓ ninja found (used as the CMake generator)"
+else
+    echo "ℹ  ninja not found — building with Unix Makefiles"
+    echo "   Install ninja for faster rebuilds (brew install ninja / sudo apt install ninja-build)"
+fi
+
+if [ "${GIT_CHECKOUT}" = "0" ]; then
+    echo "ℹ  Not a git checkout — submodules must already be present"
+elif ! command -v git &>/dev/null; then
     echo "✗ git not found. Install git and try again."
     exit 1
+else
+    echo "✓ git found"
 fi
-echo "✓ git found"
 
 # ── C++ compiler + platform system deps ──────────────────────────────────────
 if [ "${PLATFORM}" = "Darwin" ]; then
@@ -153,22 +232,22 @@ fi
 echo ""
 
 # ── Step 2: Initialize LUSID submodule ────────────────────────────────────────
-echo "Step 2: Initializing LUSID submodule..."
+echo "Step 2: Checking LUSID submodule..."
 ensure_submodule "internal/LUSID" "${PROJECT_ROOT}/internal/LUSID/README.md"
 echo ""
 
 # ── Step 3: Initialize cult-allolib submodule ─────────────────────────────────
-echo "Step 3: Initializing cult-allolib submodule..."
+echo "Step 3: Checking cult-allolib submodule..."
 ensure_submodule "internal/cult-allolib" "${PROJECT_ROOT}/internal/cult-allolib/include" "yes"
 echo ""
 
 # ── Step 4: Initialize cult_transcoder submodule ──────────────────────────────
-echo "Step 4: Initializing cult_transcoder submodule..."
+echo "Step 4: Checking cult_transcoder submodule..."
 ensure_submodule "internal/cult_transcoder" "${PROJECT_ROOT}/internal/cult_transcoder/thirdparty/libbw64/include/bw64/bw64.hpp" "yes"
 echo ""
 
 # ── Step 5: Initialize libsndfile submodule ──────────────────────────────────
-echo "Step 5: Initializing libsndfile submodule..."
+echo "Step 5: Checking libsndfile submodule..."
 ensure_submodule "thirdparty/libsndfile" "${PROJECT_ROOT}/thirdparty/libsndfile/CMakeLists.txt"
 echo ""
 
@@ -177,7 +256,7 @@ echo ""
 #   git submodule add https://github.com/ocornut/imgui.git thirdparty/imgui
 IMGUI_DIR="${PROJECT_ROOT}/thirdparty/imgui"
 if [ -f "${PROJECT_ROOT}/.gitmodules" ] && grep -q "thirdparty/imgui" "${PROJECT_ROOT}/.gitmodules" 2>/dev/null; then
-    echo "Step 6: Initializing Dear ImGui submodule..."
+    echo "Step 6: Checking Dear ImGui submodule..."
     ensure_submodule "thirdparty/imgui" "${IMGUI_DIR}/imgui.h"
 else
     echo "ℹ  thirdparty/imgui not registered (GUI build not enabled)"
@@ -189,17 +268,23 @@ echo ""
 #   git submodule add https://github.com/glfw/glfw.git thirdparty/glfw
 GLFW_DIR="${PROJECT_ROOT}/thirdparty/glfw"
 if [ -f "${PROJECT_ROOT}/.gitmodules" ] && grep -q "thirdparty/glfw" "${PROJECT_ROOT}/.gitmodules" 2>/dev/null; then
-    echo "Step 7: Initializing GLFW submodule..."
+    echo "Step 7: Checking GLFW submodule..."
     ensure_submodule "thirdparty/glfw" "${GLFW_DIR}/CMakeLists.txt"
 else
     echo "ℹ  thirdparty/glfw not registered (GUI build not enabled)"
 fi
 echo ""
 
+# ── Fetch queued submodules ───────────────────────────────────────────────────
+fetch_submodules
+echo ""
+
 # ── Step 8: Build all C++ components ─────────────────────────────────────────
 echo "Step 8: Building all C++ components..."
 echo ""
-"${PROJECT_ROOT}/build.sh" --gui "$@"
+# Submodules were verified above; tell build.sh not to re-check them.
+SPATIALROOT_SUBMODULES_READY=1 "${PROJECT_ROOT}/build.sh" --gui "${BUILD_ARGS[@]}"
+touch "${INIT_STAMP}"
 
 echo ""
 echo "============================================================"
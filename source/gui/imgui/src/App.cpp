@@ -189,14 +189,14 @@ void App::requestShutdown() {
         mState = AppState::Idle;
     }
     if (mState == AppState::Transcoding && mTranscoder.isRunning()) {
-        appendEngineLog("[GUI] Waiting for active transcode to finish before cleanup...",
+        appendEngineLog("[GUI] Interrupting active transcode before cleanup...",
                         {1.f, 0.8f, 0.2f, 1.f});
-        mTranscoder.wait();
+        mTranscoder.interrupt();
     }
     if (mTcRunner.isRunning()) {
-        appendEngineLog("[GUI] Waiting for manual transcode to finish before cleanup...",
+        appendEngineLog("[GUI] Interrupting manual transcode before cleanup...",
                         {1.f, 0.8f, 0.2f, 1.f});
-        mTcRunner.wait();
+        mTcRunner.interrupt();
     }
     cleanupOwnedTempSessions(true);
 }
@@ -335,7 +335,7 @@ void App::renderEngineTab() {
         ImGui::TextDisabled("BUFFER");
         ImGui::SameLine(120.f);
         ImGui::SetNextItemWidth(100.f);
-        ImGui::Combo("##bufsize", &mBufferSizeIdx, kBufferSizeNames, 5);
+        ImGui::Combo("##bufsize", &mBufferSizeIdx, kBufferSizeNames, IM_ARRAYSIZE(kBufferSizeNames));
 
         if (isRunning) ImGui::EndDisabled();
     }
@@ -378,8 +378,13 @@ void App::renderEngineTab() {
         if (!mLastGeneratedSceneAvailable || !mActiveTempSessionRoot) ImGui::EndDisabled();
 
         ImGui::SameLine();
-        const bool hasDiagnostics = hasDiagnosticsFiles(mActiveTempSessionRoot) ||
-                                    hasDiagnosticsFiles(mTcTempSessionRoot);
+        const double now = ImGui::GetTime();
+        if (mDiagnosticsProbeTime < 0.0 || now - mDiagnosticsProbeTime >= kDiagnosticsProbeInterval) {
+            mHasDiagnosticsFiles = hasDiagnosticsFiles(mActiveTempSessionRoot) ||
+                                   hasDiagnosticsFiles(mTcTempSessionRoot);
+            mDiagnosticsProbeTime = now;
+        }
+        const bool hasDiagnostics = mHasDiagnosticsFiles;
         if (!hasDiagnostics) ImGui::BeginDisabled(true);
         if (ImGui::Button("Save Diagnostic Files")) {
             if (mActiveTempSessionRoot) {
@@ -560,9 +565,10 @@ void App::renderTranscodeTab() {
                     std::transform(lower.begin(), lower.end(), lower.begin(), ::tolower);
                     fmt = (lower.size() > 4 && lower.substr(lower.size() - 4) == ".xml") ? "adm_xml" : "adm_wav";
                 }
-                const std::string outDisp = mTcOutput.empty() ? "<temp>/scene.lusid.json" : mTcOutput;
+                const std::string outDisp = mTcOutput.empty() ? "<temp>/scene.lusid.json"
+                                                              : SubprocessRunner::quoteArg(mTcOutput);
                 cmdPreview = "cult-transcoder transcode"
-                    " --in " + (mTcInput.empty() ? "<input>" : mTcInput) +
+                    " --in " + (mTcInput.empty() ? "<input>" : SubprocessRunner::quoteArg(mTcInput)) +
                     " --in-format " + fmt +
                     " --out " + outDisp +
                     " --out-format lusid_json"
@@ -609,7 +615,7 @@ void App::renderTranscodeTab() {
                             "--stdout-report",
                             "--lfe-mode", kTcLfeModeValues[mTcLfeMode],
                         };
-                        appendTcLog("[GUI] Running: cult-transcoder transcode ...");
+                        appendTcLog("[GUI] Running: " + SubprocessRunner::formatCommand(args));
                         mTcRunner.start(args, [this](const std::string& line) { appendTcLog(line); });
                     }
                 }
@@ -679,8 +685,8 @@ void App::renderTranscodeTab() {
 
             // Build command preview for workflow 1
             cmdPreview = "cult-transcoder package-adm-wav"
-                " --in " + (mTcPkgInput.empty() ? "<source.wav>" : mTcPkgInput) +
-                " --out-package " + (mTcPkgOutput.empty() ? "<package-dir>" : mTcPkgOutput) +
+                " --in " + (mTcPkgInput.empty() ? "<source.wav>" : SubprocessRunner::quoteArg(mTcPkgInput)) +
+                " --out-package " + (mTcPkgOutput.empty() ? "<package-dir>" : SubprocessRunner::quoteArg(mTcPkgOutput)) +
                 " --lfe-mode " + kTcLfeModeValues[mTcPkgLfeMode] +
                 " --stdout-report";
 
@@ -708,7 +714,7 @@ void App::renderTranscodeTab() {
                             "--stdout-report",
                             "--lfe-mode", kTcLfeModeValues[mTcPkgLfeMode],
                         };
-                        appendTcLog("[GUI] Running: cult-transcoder package-adm-wav ...");
+                        appendTcLog("[GUI] Running: " + SubprocessRunner::formatCommand(args));
                         mTcRunner.start(args, [this](const std::string& line) { appendTcLog(line); });
                     }
                 }
@@ -845,15 +851,15 @@ void App::renderTranscodeTab() {
             {
                 cmdPreview = "cult-transcoder adm-author";
                 if (mTcAdmInputMode == 0) {
-                    cmdPreview += " --lusid " + (mTcAdmLusid.empty() ? "<scene.lusid.json>" : mTcAdmLusid);
-                    cmdPreview += " --wav-dir " + (mTcAdmWavDir.empty() ? "<wav-dir>" : mTcAdmWavDir);
+                    cmdPreview += " --lusid " + (mTcAdmLusid.empty() ? "<scene.lusid.json>" : SubprocessRunner::quoteArg(mTcAdmLusid));
+                    cmdPreview += " --wav-dir " + (mTcAdmWavDir.empty() ? "<wav-dir>" : SubprocessRunner::quoteArg(mTcAdmWavDir));
                 } else {
-                    cmdPreview += " --lusid-package " + (mTcAdmLusidPkg.empty() ? "<package-dir>" : mTcAdmLusidPkg);
+                    cmdPreview += " --lusid-package " + (mTcAdmLusidPkg.empty() ? "<package-dir>" : SubprocessRunner::quoteArg(mTcAdmLusidPkg));
                 }
-                cmdPreview += " --out-xml " + (mTcAdmOutXml.empty() ? "<export.adm.xml>" : mTcAdmOutXml);
-                cmdPreview += " --out-wav " + (mTcAdmOutWav.empty() ? "<export.wav>" : mTcAdmOutWav);
+                cmdPreview += " --out-xml " + (mTcAdmOutXml.empty() ? "<export.adm.xml>" : SubprocessRunner::quoteArg(mTcAdmOutXml));
+                cmdPreview += " --out-wav " + (mTcAdmOutWav.empty() ? "<export.wav>" : SubprocessRunner::quoteArg(mTcAdmOutWav));
                 cmdPreview += " --stdout-report";
-                if (!mTcAdmDbmdSrc.empty()) cmdPreview += " --dbmd-source " + mTcAdmDbmdSrc;
+                if (!mTcAdmDbmdSrc.empty()) cmdPreview += " --dbmd-source " + SubprocessRunner::quoteArg(mTcAdmDbmdSrc);
                 if (mTcAdmMetadataPostData) cmdPreview += " --metadata-post-data";
             }
 
@@ -894,7 +900,7 @@ void App::renderTranscodeTab() {
                         if (!mTcAdmDbmdSrc.empty()) { args.push_back("--dbmd-source"); args.push_back(mTcAdmDbmdSrc); }
                         if (mTcAdmMetadataPostData) args.push_back("--metadata-post-data");
 
-                        appendTcLog("[GUI] Running: cult-transcoder adm-author ...");
+                        appendTcLog("[GUI] Running: " + SubprocessRunner::formatCommand(args));
                         mTcRunner.start(args, [this](const std::string& line) { appendTcLog(line); });
                     }
                 }
@@ -995,6 +1001,7 @@ void App::onStart() {
         };
         appendEngineLog("[GUI] ADM source detected. Running cult-transcoder...",
                         {1.f, 0.8f, 0.2f, 1.f});
+        appendEngineLog("[GUI] Running: " + SubprocessRunner::formatCommand(args));
         mState = AppState::Transcoding;
         mTranscoder.start(args, [this](const std::string& line) { appendEngineLog("[transcoder] " + line); });
     } else {
@@ -1131,13 +1138,15 @@ void App::detectSource() {
     mSourceHint.clear();
     if (mSourcePath.empty()) return;
 
+    // One stat() answers exists / file / directory.
     std::error_code ec;
     const fs::path p(mSourcePath);
-    if (!fs::exists(p, ec)) {
+    const fs::file_status st = fs::status(p, ec);
+    if (!fs::exists(st)) {
         mSourceHint = "Path does not exist";
         return;
     }
-    if (fs::is_regular_file(p, ec)) {
+    if (fs::is_regular_file(st)) {
         std::string ext = p.extension().string();
         std::transform(ext.begin(), ext.end(), ext.begin(), ::tolower);
         if (ext == ".wav") {
@@ -1146,7 +1155,7 @@ void App::detectSource() {
         } else {
             mSourceHint = "Unrecognized file type — expected .wav (ADM)";
         }
-    } else if (fs::is_directory(p, ec)) {
+    } else if (fs::is_directory(st)) {
         if (fs::exists(p / "scene.lusid.json", ec)) {
             mSourceIsLusid = true;
             mSourceHint = "Detected: LUSID package";
@@ -1162,6 +1171,9 @@ std::string App::resolveProjectPath(const std::string& relPath) const {
 }
 
 std::string App::findCultTranscoder() const {
+    // Only a hit is cached: a miss is re-probed so that building
+    // cult-transcoder while the GUI is open still gets picked up.
+    if (!mCultTranscoderPath.empty()) return mCultTranscoderPath;
     std::vector<std::string> candidates = {
         resolveProjectPath("build/internal/cult_transcoder/cult-transcoder"),
         resolveProjectPath("internal/cult_transcoder/build/cult-transcoder"),
@@ -1169,8 +1181,9 @@ std::string App::findCultTranscoder() const {
 #ifdef _WIN32
     for (auto& c : candidates) c += ".exe";
 #endif
+    std::error_code ec;
     for (const auto& c : candidates) {
-        if (fs::exists(c)) return c;
+        if (fs::is_regular_file(c, ec)) return mCultTranscoderPath = c;
     }
     return "";
 }
@@ -1188,6 +1201,7 @@ fs::path App::createOwnedTempSession(const std::string& sessionType,
                                      const std::string& sourcePath,
                                      TempSessionManifest& manifestOut) {
     const fs::path sessionRoot = SpatialRootPaths::createTempSessionRoot(mTempRootOverride);
+    mDiagnosticsProbeTime = -1.0;
     manifestOut = {};
     manifestOut.sessionId = sessionRoot.filename().string();
     manifestOut.createdAtUtc = SpatialRootPaths::makeCreatedAtUtc();
@@ -1280,17 +1294,20 @@ void App::cleanupOwnedTempSessions(bool forceNow) {
 
     cleanupOne(mActiveTempSessionRoot, mActiveTempManifest, true, true);
     cleanupOne(mTcTempSessionRoot, mTcTempManifest, false, true);
+    mDiagnosticsProbeTime = -1.0;
 }
 
 void App::clearTempSessionState() {
     mActiveTempSessionRoot.reset();
     mActiveTempManifest = {};
     mLastGeneratedSceneAvailable = false;
+    mDiagnosticsProbeTime = -1.0;
 }
 
 void App::clearStandaloneTranscodeTempState() {
     mTcTempSessionRoot.reset();
     mTcTempManifest = {};
+    mDiagnosticsProbeTime = -1.0;
 }
 
 std::string App::pathString(const fs::path& path) {
@@ -67,6 +67,7 @@ public:
 private:
     // ── Project root & paths ─────────────────────────────────────────────
     std::string mProjectRoot;
+    mutable std::string mCultTranscoderPath;  // cached hit from findCultTranscoder()
     bool        mKeepTempSessions = false;
     std::string mTempRootOverride;
 
@@ -109,6 +110,11 @@ private:
     TempSessionManifest     mActiveTempManifest;
     bool                    mLastGeneratedSceneAvailable = false;
     bool                    mLastFailureHasDiagnostics = false;
+    // "Save Diagnostic Files" enablement: hasDiagnosticsFiles() stats up to four
+    // paths, so it is re-probed at most every kDiagnosticsProbeInterval seconds
+    // (or immediately after a temp session is created/removed), not every frame.
+    bool                    mHasDiagnosticsFiles  = false;
+    double                  mDiagnosticsProbeTime = -1.0;  // ImGui::GetTime(); <0 = stale
 
     // ── Engine log ────────────────────────────────────────────────────────
     std::deque<LogEntry> mEngineLog;
@@ -155,9 +161,10 @@ private:
     unsigned int mLogoTexId = 0;  // GLuint — avoids pulling GL headers into App.hpp
 
     // ── Static constants ─────────────────────────────────────────────────
-    static constexpr int kBufferSizes[]      = {64, 128, 256, 512, 1024};
+    static constexpr double kDiagnosticsProbeInterval = 0.5;  // seconds
+    static constexpr int kBufferSizes[]      = {64, 128, 256, 512, 1024, 0};  // 0 = driver default
     static constexpr const char* kBufferSizeNames[] =
-        {"64", "128", "256", "512", "1024"};
+        {"64", "128", "256", "512", "1024", "Auto"};
     static constexpr const char* kLayoutNames[] =
         {"AlloSphere", "Translab", "Stereo", "Krakow", "Layout Template",
          "Circle 16", "Circle 12", "Cube 8", "Ring12 Top4", "Ring8 Top4",
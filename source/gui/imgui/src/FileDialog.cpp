@@ -72,9 +72,36 @@ std::string pickDirectory(const std::string& title) {
 // ─────────────────────────────────────────────────────────────────────────────
 #elif !defined(__APPLE__)
 
+#include <cstdlib>
+#include <unistd.h>
+
+// PATH lookup for zenity, done once per process in-process (no `which` /
+// shell fork). Lets a missing zenity fail fast instead of popen()ing a shell
+// that can only report "command not found" on every click.
+static bool zenityAvailable() {
+    static const bool available = [] {
+        const char* path = std::getenv("PATH");
+        if (!path) return false;
+        std::string dirs(path);
+        size_t start = 0;
+        while (start <= dirs.size()) {
+            size_t end = dirs.find(':', start);
+            if (end == std::string::npos) end = dirs.size();
+            std::string dir = dirs.substr(start, end - start);
+            if (dir.empty()) dir = ".";
+            if (::access((dir + "/zenity").c_str(), X_OK) == 0) return true;
+            start = end + 1;
+        }
+        return false;
+    }();
+    return available;
+}
+
 std::string pickFile(const std::string&              title,
                      const std::vector<std::string>& filterPatterns,
                      const std::string&              filterDescription) {
+    if (!zenityAvailable()) return {};
+
     std::string cmd = "zenity --file-selection --title=\"" + title + "\"";
     if (!filterDescription.empty()) {
         cmd += " --file-filter=\"" + filterDescription;
@@ -104,6 +131,8 @@ std::string pickFileOrDirectory(const std::string& title) {
 }
 
 std::string pickDirectory(const std::string& title) {
+    if (!zenityAvailable()) return {};
+
     std::string cmd = "zenity --file-selection --directory --title=\"" + title + "\" 2>/dev/null";
     FILE* pipe = popen(cmd.c_str(), "r");
     if (!pipe) return {};
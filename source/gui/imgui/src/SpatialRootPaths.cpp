@@ -4,6 +4,7 @@
 #include <cstdlib>
 #include <fstream>
 #include <iomanip>
+#include <mutex>
 #include <random>
 #include <sstream>
 #include <stdexcept>
@@ -116,8 +117,8 @@ void SpatialRootPaths::writeTempSessionMarker(const fs::path& sessionRoot) {
 
 void SpatialRootPaths::writeManifest(const fs::path& sessionRoot,
                                      const TempSessionManifest& manifest) {
-    std::ofstream out(sessionRoot / "manifest.json", std::ios::trunc);
-    out << "{\n"
+    std::ostringstream json;
+    json << "{\n"
         << "  \"sessionId\": \"" << escapeJson(manifest.sessionId) << "\",\n"
         << "  \"createdAtUtc\": \"" << escapeJson(manifest.createdAtUtc) << "\",\n"
         << "  \"sourcePath\": \"" << escapeJson(manifest.sourcePath) << "\",\n"
@@ -126,6 +127,35 @@ void SpatialRootPaths::writeManifest(const fs::path& sessionRoot,
         << "  \"saved\": " << (manifest.saved ? "true" : "false") << ",\n"
         << "  \"preserved\": " << (manifest.preserved ? "true" : "false") << "\n"
         << "}\n";
+    const std::string content = json.str();
+
+    // updateManifest() is called on every status transition; skip the rewrite
+    // when the serialized manifest is already on disk byte-for-byte.
+    const fs::path manifestPath = sessionRoot / "manifest.json";
+    std::error_code ec;
+    if (fs::file_size(manifestPath, ec) == content.size() && !ec) {
+        std::ifstream in(manifestPath, std::ios::binary);
+        std::string existing(content.size(), '\0');
+        if (in.read(existing.data(), static_cast<std::streamsize>(existing.size())) &&
+            existing == content) {
+            return;
+        }
+    }
+
+    // Write beside the manifest and rename over it, so a reader (cleanup, a
+    // second GUI instance) never sees a half-written file.
+    const fs::path tmpPath = sessionRoot / "manifest.json.tmp";
+    {
+        std::ofstream out(tmpPath, std::ios::trunc | std::ios::binary);
+        out << content;
+        if (!out.flush()) {
+            out.close();
+            fs::remove(tmpPath, ec);
+            return;
+        }
+    }
+    fs::rename(tmpPath, manifestPath, ec);
+    if (ec) fs::remove(tmpPath, ec);
 }
 
 fs::path SpatialRootPaths::normalizeForComparison(const fs::path& path) {
@@ -142,8 +172,30 @@ bool SpatialRootPaths::isSafeTempSessionPath(const fs::path& candidate,
 
     const fs::path session = normalizeForComparison(candidate);
     const fs::path sessionsRoot = normalizeForComparison(tempSessionsRoot);
-    const fs::path home = normalizeForComparison(homeDirectory());
-    const fs::path cwd = normalizeForComparison(fs::current_path());
+    // home and cwd rarely change between calls, and weakly_canonical() stats
+    // every component, so only re-normalize when the raw path differs from the
+    // last one seen.
+    static std::mutex cacheMutex;
+    static fs::path homeRaw, homeNorm, cwdRaw, cwdNorm;
+    static bool cacheValid = false;
+    std::error_code ec;
+    const fs::path homeNow = homeDirectory();
+    const fs::path cwdNow = fs::current_path(ec);
+    fs::path home, cwd;
+    {
+        std::lock_guard<std::mutex> lock(cacheMutex);
+        if (!cacheValid || homeNow != homeRaw) {
+            homeRaw = homeNow;
+            homeNorm = normalizeForComparison(homeNow);
+        }
+        if (!cacheValid || cwdNow != cwdRaw) {
+            cwdRaw = cwdNow;
+            cwdNorm = normalizeForComparison(cwdNow);
+        }
+        cacheValid = true;
+        home = homeNorm;
+        cwd = cwdNorm;
+    }
 
     if (session.empty() || sessionsRoot.empty()) return false;
     if (session == sessionsRoot) return false;
@@ -1,18 +1,35 @@
 #include "SubprocessRunner.hpp"
 
+#include <algorithm>
 #include <array>
+#include <cctype>
+#include <chrono>
 #include <cstdio>
+#include <cstring>
 #include <sstream>
 
 #ifdef _WIN32
 #  define POPEN  _popen
 #  define PCLOSE _pclose
 #else
+#  include <cerrno>
+#  include <csignal>
+#  include <fcntl.h>
+#  include <spawn.h>
 #  include <sys/wait.h>
-#  define POPEN  popen
-#  define PCLOSE pclose
+#  include <unistd.h>
+extern char** environ;
+// posix_spawn can only close the GUI's other descriptors in the child on
+// macOS (POSIX_SPAWN_CLOEXEC_DEFAULT) and glibc >= 2.34 (addclosefrom_np).
+// Everywhere else (older glibc, musl, the BSDs) fall back to fork() with an
+// explicit close loop.
+#  if defined(__APPLE__) || \
+      (defined(__GLIBC__) && (__GLIBC__ > 2 || (__GLIBC__ == 2 && __GLIBC_MINOR__ >= 34)))
+#    define SPATIALROOT_SPAWN_CLOSES_FDS 1
+#  endif
 #endif
 
+#ifdef _WIN32
 // ── Command quoting ───────────────────────────────────────────────────────────
 // Build a shell-safe quoted command string from a token list.
 // Each token is wrapped in double quotes; internal double quotes are backslash-
@@ -32,6 +49,42 @@ static std::string buildCommand(const std::vector<std::string>& tokens) {
     cmd << " 2>&1";
     return cmd.str();
 }
+#endif
+
+// ── Display quoting ───────────────────────────────────────────────────────────
+
+std::string SubprocessRunner::quoteArg(const std::string& arg) {
+    bool safe = !arg.empty();
+    for (unsigned char c : arg) {
+        if (!(std::isalnum(c) || (c && std::strchr("_@%+=:,./-", c)))) { safe = false; break; }
+    }
+    if (safe) return arg;
+#ifdef _WIN32
+    std::string out = "\"";
+    for (char c : arg) {
+        if (c == '"') out += '\\';
+        out += c;
+    }
+    return out + '"';
+#else
+    // POSIX: single-quote, and close/escape/reopen around embedded quotes.
+    std::string out = "'";
+    for (char c : arg) {
+        if (c == '\'') out += "'\\''";
+        else            out += c;
+    }
+    return out + '\'';
+#endif
+}
+
+std::string SubprocessRunner::formatCommand(const std::vector<std::string>& cmd_and_args) {
+    std::string out;
+    for (size_t i = 0; i < cmd_and_args.size(); ++i) {
+        if (i > 0) out += ' ';
+        out += quoteArg(cmd_and_args[i]);
+    }
+    return out;
+}
 
 // ── SubprocessRunner ──────────────────────────────────────────────────────────
 
@@ -46,6 +99,7 @@ bool SubprocessRunner::start(const std::vector<std::string>& cmd_and_args,
     if (mRunning.load(std::memory_order_relaxed)) return false;
     if (mThread.joinable()) mThread.join();  // clean up previous run
 
+#ifdef _WIN32
     std::string command = buildCommand(cmd_and_args);
     mRunning.store(true,  std::memory_order_relaxed);
     mExitCode.store(0,    std::memory_order_relaxed);
@@ -53,6 +107,102 @@ bool SubprocessRunner::start(const std::vector<std::string>& cmd_and_args,
     mThread = std::thread([this, command, output_cb]() {
         threadFunc(command, output_cb);
     });
+#else
+    std::vector<char*> argv;
+    argv.reserve(cmd_and_args.size() + 1);
+    for (const auto& tok : cmd_and_args) argv.push_back(const_cast<char*>(tok.c_str()));
+    argv.push_back(nullptr);
+
+    // Both pipe ends are close-on-exec, so neither runner's pipe leaks into a
+    // child started by the other; dup2 onto 1/2 clears the flag there.
+    // pipe2() sets it atomically; macOS has no pipe2().
+    int fds[2];
+    pid_t pid = -1;
+#if defined(__APPLE__)
+    bool piped = false;
+    if (!cmd_and_args.empty() && ::pipe(fds) == 0) {
+        ::fcntl(fds[0], F_SETFD, FD_CLOEXEC);
+        ::fcntl(fds[1], F_SETFD, FD_CLOEXEC);
+        piped = true;
+    }
+#else
+    const bool piped = !cmd_and_args.empty() && ::pipe2(fds, O_CLOEXEC) == 0;
+#endif
+
+    if (piped) {
+#ifdef SPATIALROOT_SPAWN_CLOSES_FDS
+        // posix_spawnp() avoids duplicating the GUI's address space (GL
+        // context, ImGui state, loaded scenes) the way fork() would.
+        posix_spawn_file_actions_t actions;
+        posix_spawnattr_t attr;
+        ::posix_spawn_file_actions_init(&actions);
+        ::posix_spawnattr_init(&attr);
+
+        // Child: stdout+stderr into the pipe.
+        ::posix_spawn_file_actions_adddup2(&actions, fds[1], STDOUT_FILENO);
+        ::posix_spawn_file_actions_adddup2(&actions, fds[1], STDERR_FILENO);
+
+        // Child: own process group (pgid == pid).
+        short flags = POSIX_SPAWN_SETPGROUP;
+        ::posix_spawnattr_setpgroup(&attr, 0);
+
+        // Do not leak other GUI descriptors (GL/audio devices, log files,
+        // the zenity pipe) into the child.
+#  if defined(__APPLE__)
+        flags |= POSIX_SPAWN_CLOEXEC_DEFAULT;
+        ::posix_spawn_file_actions_addinherit_np(&actions, STDIN_FILENO);
+#  else
+        ::posix_spawn_file_actions_addclosefrom_np(&actions, STDERR_FILENO + 1);
+#  endif
+        ::posix_spawnattr_setflags(&attr, flags);
+
+        pid_t child = -1;
+        if (::posix_spawnp(&child, argv[0], &actions, &attr, argv.data(), environ) == 0) {
+            pid = child;
+        }
+        ::posix_spawn_file_actions_destroy(&actions);
+        ::posix_spawnattr_destroy(&attr);
+#else
+        // Highest descriptor to close in the child (sysconf is not async-
+        // signal-safe, so query it here). Capped so a huge RLIMIT_NOFILE does
+        // not turn the close loop into millions of syscalls.
+        long maxFd = ::sysconf(_SC_OPEN_MAX);
+        if (maxFd < 0 || maxFd > 65536) maxFd = 65536;
+
+        pid = ::fork();
+        if (pid == 0) {
+            // Child: own process group, stdout+stderr into the pipe.
+            ::setpgid(0, 0);
+            ::dup2(fds[1], STDOUT_FILENO);
+            ::dup2(fds[1], STDERR_FILENO);
+            // Do not leak GUI descriptors (GL/audio devices, log files, the
+            // zenity pipe) into the child.
+            for (int fd = STDERR_FILENO + 1; fd < maxFd; ++fd) ::close(fd);
+            ::execvp(argv[0], argv.data());
+            static const char msg[] = "[error] Failed to launch subprocess\n";
+            (void)!::write(STDERR_FILENO, msg, sizeof(msg) - 1);
+            ::_exit(127);
+        }
+        // Set the group from the parent too, so killpg() works even if the
+        // child has not been scheduled yet.
+        if (pid > 0) ::setpgid(pid, pid);
+#endif
+
+        ::close(fds[1]);
+        if (pid < 0) ::close(fds[0]);
+    }
+
+    mPid.store(pid,       std::memory_order_relaxed);
+    mRunning.store(true,  std::memory_order_relaxed);
+    mExitCode.store(0,    std::memory_order_relaxed);
+
+    // A failed launch still goes through threadFunc (fd -1), so the error line
+    // reaches output_cb on the background thread like the popen() path.
+    const int readFd = pid < 0 ? -1 : fds[0];
+    mThread = std::thread([this, readFd, output_cb]() {
+        threadFunc(readFd, output_cb);
+    });
+#endif
 
     return true;
 }
@@ -62,6 +212,25 @@ int SubprocessRunner::wait() {
     return mExitCode.load(std::memory_order_relaxed);
 }
 
+int SubprocessRunner::interrupt(int graceMs) {
+#ifndef _WIN32
+    const pid_t pid = mPid.load(std::memory_order_relaxed);
+    if (pid > 0 && mRunning.load(std::memory_order_relaxed)) {
+        ::killpg(pid, SIGINT);
+        std::unique_lock<std::mutex> lock(mExitMutex);
+        const bool exited = mExitCv.wait_for(lock, std::chrono::milliseconds(graceMs), [this] {
+            return !mRunning.load(std::memory_order_relaxed);
+        });
+        lock.unlock();
+        if (!exited) ::killpg(pid, SIGKILL);
+    }
+#else
+    (void)graceMs;
+#endif
+    return wait();
+}
+
+#ifdef _WIN32
 void SubprocessRunner::threadFunc(std::string command, OutputCallback cb) {
     FILE* pipe = POPEN(command.c_str(), "r");
     if (!pipe) {
@@ -81,11 +250,67 @@ void SubprocessRunner::threadFunc(std::string command, OutputCallback cb) {
     }
 
     int ret = PCLOSE(pipe);
-#ifndef _WIN32
-    // pclose() returns the raw waitpid() status — extract the actual exit code.
-    if (WIFEXITED(ret))   ret = WEXITSTATUS(ret);
-    else if (WIFSIGNALED(ret)) ret = 128 + WTERMSIG(ret);
-#endif
     mExitCode.store(ret,   std::memory_order_relaxed);
     mRunning.store(false,  std::memory_order_relaxed);
 }
+#else
+void SubprocessRunner::threadFunc(int fd, OutputCallback cb) {
+    if (fd < 0) {
+        if (cb) cb("[error] Failed to launch subprocess");
+        mExitCode.store(-1,    std::memory_order_relaxed);
+        {
+            std::lock_guard<std::mutex> lock(mExitMutex);
+            mRunning.store(false,  std::memory_order_relaxed);
+        }
+        mExitCv.notify_all();
+        return;
+    }
+
+    // Drain the pipe in large read() chunks and split lines ourselves: one
+    // syscall covers a whole burst of renderer output, so the child never
+    // stalls on a full pipe while we feed the log line by line. A bare '\r'
+    // (progress-bar style updates) also ends a line, and text with no line
+    // break is flushed once it reaches the chunk size so it neither waits for
+    // EOF nor grows without bound.
+    auto emit = [&cb](std::string& line) {
+        if (!line.empty() && cb) cb(line);
+        line.clear();
+    };
+
+    std::vector<char> buf(64 * 1024);
+    std::string line;
+    for (;;) {
+        const ssize_t n = ::read(fd, buf.data(), buf.size());
+        if (n < 0 && errno == EINTR) continue;
+        if (n <= 0) break;
+        const char* p   = buf.data();
+        const char* end = p + n;
+        while (p < end) {
+            const char* brk = std::find_if(p, end, [](char c) { return c == '\n' || c == '\r'; });
+            line.append(p, brk);
+            if (brk == end) break;
+            emit(line);
+            p = brk + 1;
+        }
+        if (line.size() >= buf.size()) emit(line);
+    }
+    emit(line);
+    ::close(fd);
+
+    const pid_t pid = mPid.load(std::memory_order_relaxed);
+    int status = 0;
+    while (::waitpid(pid, &status, 0) < 0 && errno == EINTR) {}
+
+    // Extract the actual exit code from the raw waitpid() status.
+    int ret = -1;
+    if (WIFEXITED(status))        ret = WEXITSTATUS(status);
+    else if (WIFSIGNALED(status)) ret = 128 + WTERMSIG(status);
+    mPid.store(-1,         std::memory_order_relaxed);
+    mExitCode.store(ret,   std::memory_order_relaxed);
+    {
+        std::lock_guard<std::mutex> lock(mExitMutex);
+        mRunning.store(false,  std::memory_order_relaxed);
+    }
+    mExitCv.notify_all();
+}
+#endif
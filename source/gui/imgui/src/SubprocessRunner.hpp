@@ -4,6 +4,12 @@
 // Runs a subprocess (e.g. cult-transcoder) on a background thread and streams
 // its stdout+stderr (merged via 2>&1) to an OutputCallback, one line at a time.
 //
+// On POSIX the child is started with posix_spawnp() (no shell) as the leader
+// of its own process group, so interrupt() can signal it together with
+// anything it spawned in one killpg() call. It inherits only stdin and the
+// output pipe; other GUI descriptors are closed at spawn. Windows keeps the
+// popen() path.
+//
 // Thread safety: OutputCallback is called from the background thread.
 // The caller is responsible for protecting any shared state the callback touches
 // (e.g., lock a mutex before appending to a shared log deque).
@@ -16,7 +22,9 @@
 //   int code = runner.exitCode();
 
 #include <atomic>
+#include <condition_variable>
 #include <functional>
+#include <mutex>
 #include <string>
 #include <thread>
 #include <vector>
@@ -40,8 +48,31 @@ public:
     // Block until the subprocess finishes. Returns exit code.
     int wait();
 
+    // Stop the subprocess: SIGINT to its process group, SIGKILL if it is still
+    // alive after graceMs. Blocks until it has exited. Returns exit code.
+    // Windows: no process handle is available, so this behaves like wait().
+    int interrupt(int graceMs = 5000);
+
+    // Quote one argument for display so it can be pasted back into a shell.
+    // Arguments made only of shell-safe characters are returned unchanged.
+    static std::string quoteArg(const std::string& arg);
+
+    // Join a token list into a copy-pasteable command line (for logs/previews).
+    static std::string formatCommand(const std::vector<std::string>& cmd_and_args);
+
 private:
+#ifdef _WIN32
     void threadFunc(std::string command, OutputCallback cb);
+#else
+    void threadFunc(int fd, OutputCallback cb);
+
+    std::atomic<int>      mPid{-1};  // child pid == process group id, -1 when idle
+
+    // Signalled by threadFunc once waitpid() has reaped the child, so
+    // interrupt() can sleep until exit or deadline without polling.
+    std::mutex              mExitMutex;
+    std::condition_variable mExitCv;
+#endif
 
     std::thread           mThread;
     std::atomic<bool>     mRunning{false};
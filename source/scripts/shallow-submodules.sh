@@ -35,11 +35,10 @@
 #     inside the submodule.  That is intentional.
 #
 # COMPATIBILITY
-#   Default init.sh and CI both use full checkout by default; this script is
-#   an explicit opt-in for developers who want to reduce local disk usage.
-#   After running this script, subsequent `git submodule update` invocations
-#   will remain shallow as long as .gitmodules has `shallow = true` for each
-#   submodule (set by this script's companion change to .gitmodules).
+#   init.sh, build.sh and the CMake submodule check already fetch with
+#   --depth 1, and .gitmodules sets `shallow = true` for every submodule, so
+#   fresh clones start shallow. This script converts checkouts made before
+#   that (full history under .git/modules) in place.
 #
 # =============================================================================
 
@@ -158,8 +157,10 @@ for SUBPATH in "${SUBMODULE_PATHS[@]}"; do
         rm -rf "$MODULES_DIR"
     fi
 
-    # Also remove the working tree entry if it still exists as a stale dir
-    if [ -d "$REPO_ROOT/$SUBPATH" ] && [ -z "$(ls -A "$REPO_ROOT/$SUBPATH" 2>/dev/null)" ]; then
+    # Also remove the working tree entry if it still exists as a stale dir.
+    # rmdir only succeeds on an empty directory, so it is its own emptiness
+    # check (no `ls -A` subshell).
+    if [ -d "$REPO_ROOT/$SUBPATH" ]; then
         rmdir "$REPO_ROOT/$SUBPATH" 2>/dev/null || true
     fi
 
@@ -189,8 +190,8 @@ echo ""
 echo "All done."
 echo ""
 echo "Notes:"
-echo "  • Future clones will be shallow if .gitmodules has 'shallow = true'"
-echo "    for each submodule (see companion change)."
+echo "  • Future clones stay shallow: .gitmodules sets 'shallow = true'"
+echo "    for each submodule."
 echo "  • To deepen a submodule later:"
 echo "      git -C internal/cult-allolib fetch --unshallow"
 echo "  • To verify shallow status:"
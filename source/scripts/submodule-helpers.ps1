@@ -0,0 +1,55 @@
+# source/scripts/submodule-helpers.ps1 — shared by init.ps1 and build.ps1
+#
+# Dot-sourced, not executed. The caller must set $ProjectRoot first.
+#
+# Defines:
+#   $NumCores                         job count (MAKE_PROCS / CMAKE_BUILD_PARALLEL_LEVEL
+#                                     override, else logical cores)
+#   $GitCheckout                      $true when $ProjectRoot is a git checkout with .gitmodules
+#   Test-SubmoduleMissingRecursive    <Path>  → $true if <Path> or a nested submodule is uninitialized
+#   Stop-NotACheckout                 <Path> <Sentinel>  → prints a hint and exits 1
+
+# MAKE_PROCS / CMAKE_BUILD_PARALLEL_LEVEL cap the job count on hosts where one
+# compiler per core would run out of memory. Only positive integers are
+# accepted; anything else would fail deep inside --parallel / --jobs.
+$NumCores = [Environment]::ProcessorCount
+foreach ($var in "MAKE_PROCS", "CMAKE_BUILD_PARALLEL_LEVEL") {
+    $val = [Environment]::GetEnvironmentVariable($var)
+    if (-not $val) { continue }
+    if ($val -match '^[1-9][0-9]*$') {
+        $NumCores = [int]$val
+        break
+    }
+    Write-Host "ℹ Ignoring $var='$val' (not a positive integer)"
+}
+
+# Source archives / exported trees have no .git (or no .gitmodules): there is
+# nothing for git to inspect or repair, so never start it there.
+$GitCheckout = (Test-Path (Join-Path $ProjectRoot ".git")) -and
+               (Test-Path (Join-Path $ProjectRoot ".gitmodules"))
+
+# One `git submodule status --recursive` for the whole tree, loaded on first
+# use and shared by every check (instead of one git call per path).
+$script:SubmoduleStatus = $null
+
+function Test-SubmoduleMissingRecursive([string]$Path) {
+    if (-not $GitCheckout) { return $false }
+    if ($null -eq $script:SubmoduleStatus) {
+        $script:SubmoduleStatus = @(git -C $ProjectRoot submodule status --recursive 2>$null)
+    }
+    # Uninitialized entries start with '-'; match the path itself or anything
+    # nested under it.
+    foreach ($line in $script:SubmoduleStatus) {
+        if (-not $line.StartsWith("-")) { continue }
+        $entry = ($line.Substring(1) -split " ")[1]
+        if ($entry -eq $Path -or $entry.StartsWith("$Path/")) { return $true }
+    }
+    return $false
+}
+
+function Stop-NotACheckout([string]$Path, [string]$Sentinel) {
+    Write-Host "✗ $Path is missing ($Sentinel) and $ProjectRoot is not a git checkout." -ForegroundColor Red
+    Write-Host "  Clone with 'git clone --recursive', or use a source archive that"
+    Write-Host "  includes the submodule sources."
+    exit 1
+}
@@ -0,0 +1,71 @@
+# source/scripts/submodule-helpers.sh — shared by init.sh and build.sh
+#
+# Sourced, not executed. The caller must set PROJECT_ROOT first.
+#
+# Defines:
+#   NUM_CORES                         job count (MAKE_PROCS / CMAKE_BUILD_PARALLEL_LEVEL
+#                                     override, else logical cores)
+#   GIT_CHECKOUT                      1 when PROJECT_ROOT is a git checkout with .gitmodules
+#   submodule_has_missing_recursive   <path>  → 0 if <path> or a nested submodule is uninitialized
+#   not_a_checkout_error              <path> <sentinel>  → prints a hint and exits 1
+
+# ── CPU count ─────────────────────────────────────────────────────────────────
+if command -v nproc &>/dev/null; then
+    NUM_CORES=$(nproc)
+elif command -v sysctl &>/dev/null; then
+    NUM_CORES=$(sysctl -n hw.logicalcpu)
+else
+    NUM_CORES=4
+fi
+
+# MAKE_PROCS / CMAKE_BUILD_PARALLEL_LEVEL cap the job count on hosts where one
+# compiler per core would run out of memory. Only positive integers are
+# accepted; anything else would fail deep inside --parallel / --jobs.
+for _var in MAKE_PROCS CMAKE_BUILD_PARALLEL_LEVEL; do
+    _val="${!_var:-}"
+    [ -n "${_val}" ] || continue
+    case "${_val}" in
+        *[!0-9]*|0*)
+            echo "ℹ Ignoring ${_var}='${_val}' (not a positive integer)"
+            ;;
+        *)
+            NUM_CORES="${_val}"
+            break
+            ;;
+    esac
+done
+unset _var _val
+
+# Source archives / exported trees have no .git (or no .gitmodules): there is
+# nothing for git to inspect or repair, so never fork it there.
+if [ -e "${PROJECT_ROOT}/.git" ] && [ -f "${PROJECT_ROOT}/.gitmodules" ]; then
+    GIT_CHECKOUT=1
+else
+    GIT_CHECKOUT=0
+fi
+
+# One `git submodule status --recursive` for the whole tree, loaded on first
+# use and shared by every check (instead of one git call per path).
+SUBMODULE_STATUS=""
+SUBMODULE_STATUS_LOADED=0
+
+submodule_has_missing_recursive() {
+    local path="$1"
+    [ "${GIT_CHECKOUT}" = "1" ] || return 1
+    if [ "${SUBMODULE_STATUS_LOADED}" = "0" ]; then
+        SUBMODULE_STATUS="$(git -C "${PROJECT_ROOT}" submodule status --recursive 2>/dev/null || true)"
+        SUBMODULE_STATUS_LOADED=1
+    fi
+    # Uninitialized entries start with '-'; match the path itself or anything
+    # nested under it.
+    printf '%s\n' "${SUBMODULE_STATUS}" | awk -v p="$path" '
+        /^-/ && ($2 == p || index($2, p "/") == 1) { found = 1 }
+        END { exit !found }'
+}
+
+not_a_checkout_error() {
+    echo "✗ $1 is missing ($2) and ${PROJECT_ROOT} is not a git checkout."
+    echo "  Clone with 'git clone --recursive', or use a source archive that"
+    echo "  includes the submodule sources."
+    exit 1
+}
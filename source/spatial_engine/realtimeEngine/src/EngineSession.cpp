@@ -230,6 +230,22 @@ bool EngineSession::start()
         return false;
     }
 
+    // The driver may not honour the requested block size, and picks its own
+    // when bufferSize is 0. Size the render buffers to what was actually
+    // opened so no callback exceeds them.
+    const int actualFrames = static_cast<int>(mBackend->audioIO().framesPerBuffer());
+    if (actualFrames <= 0 && mConfig.bufferSize <= 0) {
+        setLastError("Audio driver did not report a block size; set an explicit buffer size.");
+        mBackend->shutdown();
+        return false;
+    }
+    if (actualFrames > 0 && actualFrames != mConfig.bufferSize) {
+        std::cout << "[EngineSession] Using driver block size: " << actualFrames
+                  << " frames." << std::endl;
+        mConfig.bufferSize = actualFrames;
+        mSpatializer->resizeBlockBuffers();
+    }
+
     mBackend->setStreaming(mStreaming.get());
     mBackend->setPose(mPose.get());
     mBackend->setSpatializer(mSpatializer.get());
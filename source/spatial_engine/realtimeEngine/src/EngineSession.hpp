@@ -59,7 +59,7 @@ struct DiagnosticEvents {
 // --- New Core API Typed Structs (per Design Doc) ---
 struct EngineOptions {
     int sampleRate = 48000;
-    int bufferSize = 512;
+    int bufferSize = 512;  // 0 = let the audio driver choose
     std::string outputDeviceName;
     int oscPort = 9009;
     ElevationMode elevationMode = ElevationMode::RescaleAtmosUp;
@@ -45,6 +45,7 @@
 #include <chrono>   // std::chrono::steady_clock (wall-clock CPU meter)
 #include <thread>   // std::this_thread::sleep_for (stop fade drain)
 #include <iostream>
+#include <sstream>
 #include <string>
 #include <functional>
 #include <cstring>  // memset, memcpy
@@ -91,11 +92,18 @@ public:
     /// Initialize the audio device. Must be called before start().
     /// Returns true on success.
     bool init() {
-        std::cout << "[Backend] Initializing audio device..." << std::endl;
-        std::cout << "  Sample rate:      " << mConfig.sampleRate << " Hz" << std::endl;
-        std::cout << "  Buffer size:      " << mConfig.bufferSize << " frames" << std::endl;
-        std::cout << "  Output channels:  " << mConfig.outputChannels << std::endl;
-        std::cout << "  Input channels:   " << mConfig.inputChannels << std::endl;
+        // Assemble the summary first and flush it once (one write, not five).
+        std::ostringstream banner;
+        banner << "[Backend] Initializing audio device...\n"
+               << "  Sample rate:      " << mConfig.sampleRate << " Hz\n";
+        if (mConfig.bufferSize > 0) {
+            banner << "  Buffer size:      " << mConfig.bufferSize << " frames\n";
+        } else {
+            banner << "  Buffer size:      driver default\n";
+        }
+        banner << "  Output channels:  " << mConfig.outputChannels << "\n"
+               << "  Input channels:   " << mConfig.inputChannels << "\n";
+        std::cout << banner.str() << std::flush;
 
         // ── Explicit output device selection ─────────────────────────────
         // If --device was provided, resolve the name to a specific AudioDevice
@@ -177,7 +185,7 @@ public:
         mAudioIO.init(
             audioCallback,              // static callback function
             this,                       // userData → passed back in callback
-            mConfig.bufferSize,         // frames per buffer
+            std::max(mConfig.bufferSize, 0), // frames per buffer (0 = driver default)
             (double)mConfig.sampleRate, // sample rate
             mConfig.outputChannels,     // output channels
             mConfig.inputChannels       // input channels
@@ -378,6 +378,21 @@ public:
         return true;
     }
 
+    // ── Re-size per-block buffers ────────────────────────────────────────
+    // Call after mConfig.bufferSize changed — e.g. the audio driver opened
+    // with a different block size than requested, or chose its own because
+    // bufferSize was 0. Channel counts set up by init() are kept.
+    //
+    // NOT real-time safe (allocates). Call before the backend starts.
+
+    void resizeBlockBuffers() {
+        mSourceBuffer.assign(mConfig.bufferSize, 0.0f);
+        mRenderIO.framesPerBuffer(mConfig.bufferSize);
+        mFastMoverScratch.framesPerBuffer(std::max(1, mConfig.bufferSize / kNumSubSteps));
+        std::cout << "[Spatializer] Block buffers resized to "
+                  << mConfig.bufferSize << " frames." << std::endl;
+    }
+
     // ── Render one audio block ───────────────────────────────────────────
     // Called from processBlock() on the audio thread.
     //
@@ -98,6 +98,7 @@
 #include <iostream>
 #include <map>
 #include <mutex>
+#include <sstream>
 #include <string>
 #include <thread>
 #include <vector>
@@ -531,6 +532,8 @@ public:
         std::cout << "[Streaming] Loading " << scene.sources.size()
                   << " sources from: " << mConfig.sourcesFolder << std::endl;
 
+        // Per-source lines are collected and written once with the summary.
+        std::ostringstream loadLog;
         for (const auto& [sourceName, keyframes] : scene.sources) {
             // Build file path: sourcesFolder/sourceName.wav
             fs::path wavPath = fs::path(mConfig.sourcesFolder) / (sourceName + ".wav");
@@ -557,10 +560,10 @@ public:
                 continue;
             }
 
-            std::cout << "  ✓ " << sourceName << " — "
-                      << stream->totalFrames << " frames ("
-                      << (double)stream->totalFrames / stream->sampleRate
-                      << "s)" << (stream->isLFE ? " [LFE]" : "") << std::endl;
+            loadLog << "  ✓ " << sourceName << " — "
+                    << stream->totalFrames << " frames ("
+                    << (double)stream->totalFrames / stream->sampleRate
+                    << "s)" << (stream->isLFE ? " [LFE]" : "") << "\n";
 
             mStreams[sourceName] = std::move(stream);
         }
@@ -568,7 +571,8 @@ public:
         mState.numSources.store(static_cast<int>(mStreams.size()),
                                 std::memory_order_relaxed);
 
-        std::cout << "[Streaming] Loaded " << mStreams.size() << " sources."
+        std::cout << loadLog.str()
+                  << "[Streaming] Loaded " << mStreams.size() << " sources."
                   << std::endl;
 
         return !mStreams.empty();
@@ -601,7 +605,10 @@ public:
         uint64_t admTotalFrames = mMultichannelReader->totalFrames();
         int      admNumChannels = mMultichannelReader->numChannels();
 
-        // Create buffer-only SourceStreams and map channels
+        // Create buffer-only SourceStreams and map channels. The per-source
+        // mapping lines are collected and written once with the summary below
+        // rather than flushed one by one.
+        std::ostringstream mapLog;
         for (const auto& [sourceName, keyframes] : scene.sources) {
             // Parse source name to get 0-based channel index
             int channelIndex = parseChannelIndex(sourceName, admNumChannels);
@@ -620,13 +627,15 @@ public:
             // Register with the multichannel reader
             mMultichannelReader->mapChannel(channelIndex, stream.get());
 
-            std::cout << "  ✓ " << sourceName << " → ADM ch " << (channelIndex + 1)
-                      << " (0-based: " << channelIndex << ")"
-                      << (stream->isLFE ? " [LFE]" : "") << std::endl;
+            mapLog << "  ✓ " << sourceName << " → ADM ch " << (channelIndex + 1)
+                   << " (0-based: " << channelIndex << ")"
+                   << (stream->isLFE ? " [LFE]" : "") << "\n";
 
             mStreams[sourceName] = std::move(stream);
         }
 
+        std::cout << mapLog.str() << std::flush;
+
         if (mStreams.empty()) {
             std::cerr << "[Streaming] FATAL: No sources could be mapped." << std::endl;
             return false;
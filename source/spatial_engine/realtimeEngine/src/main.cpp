@@ -80,7 +80,8 @@ static void printUsage(const char* progName) {
               << "  --adm <path>        Multichannel ADM WAV file\n\n"
               << "Optional:\n"
               << "  --samplerate <int>  Audio sample rate in Hz (default: 48000)\n"
-              << "  --buffersize <int>  Frames per audio callback (default: 512)\n"
+              << "  --buffersize <int>  Frames per audio callback (default: 512,\n"
+              << "                      0 = let the audio driver choose)\n"
               << "  --gain <dB>         Master gain in dB -60–+12 (default: 0, 0 dB = unity)\n"
               << "  --focus <float>     DBAP rolloff exponent 0.1–5.0 (default: 1.5)\n"
               << "  --speaker_mix <dB>  Loudspeaker mix trim in dB -60–+12 (default: 0)\n"
@@ -126,9 +127,12 @@ int main(int argc, char* argv[]) {
         return 0;
     }
 
-    std::cout << "\n╔══════════════════════════════════════════════════════════╗" << std::endl;
-    std::cout << "║  spatialroot Real-Time Spatial Audio Engine (Session API)║" << std::endl;
-    std::cout << "╚══════════════════════════════════════════════════════════╝\n" << std::endl;
+    // Emitted as one string + one flush so the header reaches the terminal
+    // in a single write instead of one per line.
+    std::cout << "\n╔══════════════════════════════════════════════════════════╗\n"
+                 "║  spatialroot Real-Time Spatial Audio Engine (Session API)║\n"
+                 "╚══════════════════════════════════════════════════════════╝\n"
+              << std::endl;
 
     EngineSession session;
 
@@ -828,10 +828,30 @@ MultiWavData SpatialRenderer::render(const RenderConfig &config) {
     }
     
     // Calculate total blocks for fallback summary
-    int totalBlocks = (renderSamples + config.blockSize - 1) / config.blockSize;
+    mLastTotalBlocks = (renderSamples + config.blockSize - 1) / config.blockSize;
     
-    // Compute and store render statistics
-    computeRenderStats(out);
+    // Restore original layout 2D setting if it was overridden
+    mLayoutIs2D = originalIs2D;
+    
+    // Post-render analysis only reads the finished buffer, so callers may
+    // run it themselves off the critical path (see RenderConfig::deferAnalysis)
+    if (!config.deferAnalysis) {
+        computeRenderStats(out);
+        reportRenderStats(config);
+    }
+    
+    std::cout << "\n";
+    return out;
+}
+
+// Print render statistics and diagnostics summaries (call after computeRenderStats)
+void SpatialRenderer::reportRenderStats(const RenderConfig &config) {
+    int numSpeakers = mLayout.speakers.size();
+    int totalBlocks = mLastTotalBlocks;
+    
+    // Report with the same 2D treatment the render used
+    bool originalIs2D = mLayoutIs2D;
+    if (config.force2D) mLayoutIs2D = true;
     
     // Log summary statistics
     std::cout << "\nRender Statistics:\n";
@@ -902,11 +922,7 @@ MultiWavData SpatialRenderer::render(const RenderConfig &config) {
         std::cout << "  Debug stats written to " << config.debugOutputDir << "/\n";
     }
     
-    // Restore original layout 2D setting if it was overridden
     mLayoutIs2D = originalIs2D;
-    
-    std::cout << "\n";
-    return out;
 }
 
 // renderPerBlock: Direction computed at block center (reduces stepping artifacts)
@@ -944,6 +960,23 @@ void SpatialRenderer::renderPerBlock(MultiWavData &out, const RenderConfig &conf
     
     std::vector<float> sourceBuffer(bufferSize, 0.0f);
     
+    // Resolve the solo filter and the audio lookup once for the whole render
+    // instead of once per source per block.
+    struct BlockSource {
+        const std::string *name;
+        const std::vector<Keyframe> *kfs;
+        const MonoWavData *src;
+        bool isLFE;    // routed straight to the subwoofers, never panned
+    };
+    std::vector<BlockSource> blockSources;
+    blockSources.reserve(mSpatial.sources.size());
+    for (const auto &[name, kfs] : mSpatial.sources) {
+        if (!config.soloSource.empty() && name != config.soloSource) continue;
+        auto srcIt = mSources.find(name);
+        if (srcIt == mSources.end()) continue;
+        blockSources.push_back({&name, &kfs, &srcIt->second, name == "LFE"});
+    }
+    
     int blocksProcessed = 0;
     for (size_t blockStart = startSample; blockStart < endSample; blockStart += bufferSize) {
         size_t blockEnd = std::min(endSample, blockStart + bufferSize);
@@ -958,19 +991,19 @@ void SpatialRenderer::renderPerBlock(MultiWavData &out, const RenderConfig &conf
         
         audioIO.zeroOut();
         
-        for (auto &[name, kfs] : mSpatial.sources) {
-            if (!config.soloSource.empty() && name != config.soloSource) continue;
+        for (const BlockSource &bs : blockSources) {
+            const std::string &name = *bs.name;
+            const std::vector<Keyframe> &kfs = *bs.kfs;
+            const MonoWavData &src = *bs.src;
             
-            auto srcIt = mSources.find(name);
-            if (srcIt == mSources.end()) continue;
-            const MonoWavData &src = srcIt->second;
-            
-            // Fill source buffer
-            std::fill(sourceBuffer.begin(), sourceBuffer.end(), 0.0f);
-            for (size_t i = 0; i < blockLen; i++) {
-                size_t globalIdx = blockStart + i;
-                sourceBuffer[i] = (globalIdx < src.samples.size()) ? src.samples[globalIdx] : 0.0f;
-            }
+            // Fill source buffer: copy what the source has, zero the rest
+            const size_t avail = (blockStart < src.samples.size())
+                ? std::min(blockLen, src.samples.size() - blockStart) : 0;
+            // Past the end of this source (or a silent ADM channel whose
+            // buffer was dropped at load): nothing to render
+            if (avail == 0) continue;
+            std::copy_n(src.samples.begin() + blockStart, avail, sourceBuffer.begin());
+            std::fill(sourceBuffer.begin() + avail, sourceBuffer.end(), 0.0f);
             
             // Compute input energy - skip expensive checks for silent blocks
             float inAbsSum = 0.0f;
@@ -985,7 +1018,7 @@ void SpatialRenderer::renderPerBlock(MultiWavData &out, const RenderConfig &conf
                 continue;
             }
             // Special handling for LFE channel / SUB (no spatialization) 
-            if (name == "LFE") {
+            if (bs.isLFE) {
                 // Example: assume mSubwooferChannels is a std::vector<int> of sub channel indices
                 float subGain = (config.masterGainLinear() * dbap_sub_compensation) / mSubwooferChannels.size(); // Could customize LFE gain if desired
                 for (size_t i = 0; i < blockLen; ++i) {
@@ -114,6 +114,11 @@ struct RenderConfig {
     // Range: 0.0 (immediate dispersion) to 1.0 (no dispersion, discontinuity at poles)
     // Default: 0.5
     float lbapDispersion = 0.5f;
+
+    // Skip post-render statistics inside render(). The caller is then
+    // responsible for computeRenderStats() + reportRenderStats(), e.g. to
+    // overlap the analysis pass with writing the output WAV.
+    bool deferAnalysis = false;
 };
 
 // Render statistics for diagnostics
@@ -146,6 +151,14 @@ public:
     
     // Get statistics from last render (call after render())
     RenderStats getLastRenderStats() const { return mLastStats; }
+    
+    // Compute statistics on rendered output. Only reads 'output' and writes
+    // mLastStats, so it is safe to run concurrently with writing the WAV.
+    void computeRenderStats(const MultiWavData &output);
+    
+    // Print statistics + diagnostics summaries and write render_stats.json
+    // (call after computeRenderStats)
+    void reportRenderStats(const RenderConfig &config);
 
 private:
     SpeakerLayoutData mLayout;
@@ -177,6 +190,7 @@ private:
     
     // Statistics from last render
     RenderStats mLastStats;
+    int mLastTotalBlocks = 0;
     
     // Layout-derived elevation constraints (computed from speaker positions)
     float mLayoutMinElRad = -1.5707963f;   // min elevation in radians (default: -pi/2)
@@ -250,9 +264,6 @@ private:
     // linear interpolation between spatial keyframes (raw, may return invalid)
     al::Vec3f interpolateDirRaw(const std::vector<Keyframe> &kfs, double t);
     
-    // Compute statistics on rendered output
-    void computeRenderStats(const MultiWavData &output);
-    
     // Detect and fix keyframe time units (samples vs seconds)
     void normalizeKeyframeTimes(double durationSec, size_t totalSamples, int sr);
     
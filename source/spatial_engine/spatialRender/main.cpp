@@ -18,6 +18,7 @@
 #include <string>
 #include <filesystem>
 #include <cstdlib>
+#include <future>
 
 #include "SpatialRenderer.hpp"
 #include "../src/JSONLoader.hpp"
@@ -57,6 +58,8 @@ void printUsage() {
               << "  --vertical-compensation [fullsphere]  Vertical compensation mode (default: enabled, AtmosUp)\n"
               << "  --force_2d            Force 2D mode (flatten all elevations)\n"
               << "  --debug_dir DIR       Output debug diagnostics to directory\n"
+              << "  --async_analysis      Compute render statistics while the output WAV\n"
+              << "                        is being written (summary printed afterwards)\n"
               << "  --help                Show this help message\n\n";
     std::cout << "Spatializers:\n"
               << "  dbap   - Distance-Based Amplitude Panning (DEFAULT)\n"
@@ -194,6 +197,8 @@ int main(int argc, char *argv[]) {
             }
         } else if (arg == "--force_2d") {
             config.force2D = true;
+        } else if (arg == "--async_analysis") {
+            config.deferAnalysis = true;
         }
     }
 
@@ -221,6 +226,28 @@ int main(int argc, char *argv[]) {
 
     bool useADM = !admFile.empty();
 
+    // Check every input once, up front, and report all missing ones together
+    // instead of failing inside whichever loader happens to run first.
+    struct InputPath { const char* flag; const fs::path* path; bool isDir; };
+    const InputPath inputs[] = {
+        {"--layout",    &layoutFile,    false},
+        {"--positions", &positionsFile, false},
+        useADM ? InputPath{"--adm",     &admFile,       false}
+               : InputPath{"--sources", &sourcesFolder, true},
+    };
+    bool inputsMissing = false;
+    for (const InputPath& in : inputs) {
+        std::error_code ec;
+        const fs::file_status st = fs::status(*in.path, ec);
+        const bool ok = in.isDir ? fs::is_directory(st) : fs::is_regular_file(st);
+        if (!ok) {
+            std::cerr << "Error: " << in.flag << " " << (in.isDir ? "folder" : "file")
+                      << " not found: " << *in.path << "\n";
+            inputsMissing = true;
+        }
+    }
+    if (inputsMissing) return 1;
+
     // layout JSON has speaker positions in radians
     // these get converted to degrees when creating al::Speaker objects in SpatialRenderer
     std::cout << "Loading layout...\n";
@@ -246,11 +273,25 @@ int main(int argc, char *argv[]) {
     SpatialRenderer renderer(layout, spatial, sources);
     MultiWavData output = renderer.render(config);
 
+    // statistics pass only reads the rendered buffer, so with --async_analysis
+    // it runs alongside the WAV write and its summary is printed afterwards
+    std::future<void> analysis;
+    if (config.deferAnalysis && !output.samples.empty()) {
+        analysis = std::async(std::launch::async, [&renderer, &output]() {
+            renderer.computeRenderStats(output);
+        });
+    }
+
     // output has consecutive channels 0 to numSpeakers
     // if you need AlloSphere hardware channel numbers with gaps you can remap later
     std::cout << "Writing output WAV: " << outFile << "\n";
     WavUtils::writeMultichannelWav(outFile.string(), output);
 
+    if (analysis.valid()) {
+        analysis.get();
+        renderer.reportRenderStats(config);
+    }
+
     std::cout << "Done.\n";
     return 0;
 }
@@ -1,7 +1,13 @@
 #include "WavUtils.hpp"
 #include <sndfile.h>
+#include <algorithm>
+#include <atomic>
+#include <exception>
 #include <filesystem>
 #include <iostream>
+#include <set>
+#include <stdexcept>
+#include <thread>
 
 namespace fs = std::filesystem;
 
@@ -30,20 +36,62 @@ WavUtils::loadSources(const std::string &folder,
 {
     std::map<std::string, MonoWavData> out;
 
+    // List the folder once instead of stat()ing every expected file, and
+    // report all missing sources together. Names absent from the listing
+    // still get one exists() check (case-insensitive volumes on macOS).
+    std::set<std::string> present;
+    std::error_code ec;
+    for (fs::directory_iterator it(folder, ec), end; !ec && it != end; it.increment(ec)) {
+        present.insert(it->path().filename().string());
+    }
+
+    std::vector<std::pair<std::string, fs::path>> jobs;
+    jobs.reserve(sourceKeys.size());
+    std::string missing;
     for (auto &[name, kf] : sourceKeys) {
-        fs::path p = fs::path(folder) / (name + ".wav");
+        const std::string file = name + ".wav";
+        if (!present.count(file) && !fs::exists(fs::path(folder) / file, ec)) {
+            missing += (missing.empty() ? "" : ", ") + file;
+            continue;
+        }
+        jobs.emplace_back(name, fs::path(folder) / file);
+    }
+    if (!missing.empty()) {
+        throw std::runtime_error("Missing source WAV(s) in " + folder + ": " + missing);
+    }
 
-        if (!fs::exists(p)) {
-            throw std::runtime_error("Missing source WAV: " + p.string());
+    // Each mono file is an independent open/read/close, so decode them on a
+    // small worker pool instead of one after another. Errors are collected per
+    // file and the first one (in source order) is rethrown after joining.
+    std::vector<MonoWavData> loaded(jobs.size());
+    std::vector<std::exception_ptr> errors(jobs.size());
+    std::atomic<size_t> next{0};
+
+    auto worker = [&]() {
+        for (size_t i = next++; i < jobs.size(); i = next++) {
+            try {
+                loaded[i] = loadMonoFile(jobs[i].second);
+            } catch (...) {
+                errors[i] = std::current_exception();
+            }
         }
+    };
 
-        MonoWavData d = loadMonoFile(p);
+    const size_t numWorkers = std::min<size_t>(
+        jobs.size(), std::max(1u, std::thread::hardware_concurrency()));
+    std::vector<std::thread> pool;
+    for (size_t w = 1; w < numWorkers; ++w) pool.emplace_back(worker);
+    worker();
+    for (auto &t : pool) t.join();
 
-        if (d.sampleRate != expectedSR) {
-            throw std::runtime_error("Sample rate mismatch in: " + p.string());
+    for (size_t i = 0; i < jobs.size(); ++i) {
+        if (errors[i]) std::rethrow_exception(errors[i]);
+
+        if (loaded[i].sampleRate != expectedSR) {
+            throw std::runtime_error("Sample rate mismatch in: " + jobs[i].second.string());
         }
 
-        out[name] = d;
+        out.emplace(jobs[i].first, std::move(loaded[i]));
     }
 
     return out;
@@ -100,16 +148,14 @@ WavUtils::loadSourcesFromADM(const std::string &admFile,
         throw std::runtime_error("ADM file must have at least 2 channels: " + admFile);
     }
 
-    // Read all frames from the multichannel file
-    std::vector<float> interleavedBuffer(info.frames * info.channels);
-    sf_count_t framesRead = sf_readf_float(snd, interleavedBuffer.data(), info.frames);
-    sf_close(snd);
-
-    if (framesRead != info.frames) {
-        throw std::runtime_error("Failed to read all frames from ADM file: " + admFile);
-    }
-
-    // Extract channels for each source
+    // Map each source to its ADM channel. Output buffers are allocated
+    // lazily, on the first block with a non-zero sample (see below).
+    struct Target {
+        const std::string *name;
+        MonoWavData *data;
+        int channelIndex;
+    };
+    std::vector<Target> targets;
     for (auto &[name, kf] : sourceKeys) {
         int channelIndex = parseChannelIndex(name, info.channels);
         if (channelIndex < 0) {
@@ -117,19 +163,81 @@ WavUtils::loadSourcesFromADM(const std::string &admFile,
             continue;
         }
 
-        MonoWavData d;
+        MonoWavData &d = out[name];
         d.sampleRate = info.samplerate;
-        d.samples.resize(info.frames);
+        targets.push_back({&name, &d, channelIndex});
+    }
 
-        // De-interleave: extract the specific channel
-        for (sf_count_t frame = 0; frame < info.frames; ++frame) {
-            d.samples[frame] = interleavedBuffer[frame * info.channels + channelIndex];
+    // Stream the file in fixed-size blocks and de-interleave each block
+    // straight into the mapped sources. Peak memory is one block of all
+    // channels instead of the whole interleaved file, and unmapped channels
+    // are never copied.
+    //
+    // A source's buffer is only allocated once a block carries a non-zero
+    // sample for it (zero-filled, so earlier silent blocks need no copy).
+    // Digitally silent channels (unused bed slots are common in ADM exports)
+    // therefore never allocate, which lowers peak memory as well as the
+    // steady state.
+    constexpr sf_count_t kBlockFrames = 65536;
+    std::vector<float> block(static_cast<size_t>(kBlockFrames) * info.channels);
+    sf_count_t framesDone = 0;
+    while (framesDone < info.frames) {
+        const sf_count_t want = std::min(kBlockFrames, info.frames - framesDone);
+        const sf_count_t got = sf_readf_float(snd, block.data(), want);
+        if (got <= 0) break;
+
+        for (const Target &t : targets) {
+            std::vector<float> &samples = t.data->samples;
+            const float *src = block.data() + t.channelIndex;
+            if (samples.empty()) {
+                bool audible = false;
+                for (sf_count_t frame = 0; frame < got && !audible; ++frame) {
+                    audible = src[frame * info.channels] != 0.0f;
+                }
+                if (!audible) continue;
+                samples.resize(info.frames);
+            }
+            float *dst = samples.data() + framesDone;
+            for (sf_count_t frame = 0; frame < got; ++frame) {
+                dst[frame] = src[frame * info.channels];
+            }
         }
+        framesDone += got;
+    }
+    sf_close(snd);
 
-        out[name] = d;
-        std::cout << "  ✓ " << name << " → ADM ch " << (channelIndex + 1) << "\n";
+    if (framesDone != info.frames) {
+        throw std::runtime_error("Failed to read all frames from ADM file: " + admFile);
     }
 
+    // Silent sources keep an empty buffer: the renderer reads past-the-end
+    // samples as zero and skips the source without panning. If every channel
+    // was silent, one full-length buffer is still allocated, since scenes
+    // without a duration field take the render length from the longest source.
+    const bool anyAudible = std::any_of(targets.begin(), targets.end(),
+                                        [](const Target &t) { return !t.data->samples.empty(); });
+    if (!anyAudible && !targets.empty()) {
+        targets.front().data->samples.resize(info.frames);
+    }
+    std::string silentNames;
+    size_t numSilent = 0;
+    if (anyAudible) {
+        for (const Target &t : targets) {
+            if (t.data->samples.empty()) {
+                silentNames += (numSilent++ ? ", " : "") + *t.name;
+            }
+        }
+    }
+
+    // One summary line instead of one per source (ADM scenes run to 128 beds
+    // and objects, and this output is usually piped into the GUI log).
+    std::cout << "  ✓ " << targets.size() << " sources mapped from "
+              << info.channels << " ADM channels";
+    if (numSilent > 0) {
+        std::cout << " (" << numSilent << " silent: " << silentNames << ")";
+    }
+    std::cout << "\n";
+
     return out;
 }
 
@@ -170,25 +278,36 @@ void WavUtils::writeMultichannelWav(const std::string &path,
         throw std::runtime_error("Cannot create WAV file");
     }
 
-    size_t totalSamples = mw.samples[0].size();
-    std::vector<float> interleaved(totalSamples * mw.channels);
+    // Interleave and write one block at a time: the planar render buffer is
+    // already in memory, so a second full-size interleaved copy would double
+    // peak memory for nothing. Each block reads every channel sequentially.
+    constexpr size_t kBlockFrames = 65536;
+    const size_t totalSamples = mw.samples[0].size();
+    const size_t expected = totalSamples * mw.channels;
+    std::vector<float> interleaved(std::min(kBlockFrames, totalSamples) * mw.channels);
 
-    std::cout << "Interleaving " << interleaved.size() << " total samples...\n";
+    std::cout << "Interleaving " << expected << " total samples in blocks...\n";
 
-    for (size_t i = 0; i < totalSamples; i++) {
+    sf_count_t written = 0;
+    for (size_t start = 0; start < totalSamples; start += kBlockFrames) {
+        const size_t frames = std::min(kBlockFrames, totalSamples - start);
         for (int ch = 0; ch < mw.channels; ch++) {
-            interleaved[i * mw.channels + ch] = mw.samples[ch][i];
+            const float *src = mw.samples[ch].data() + start;
+            float *dst = interleaved.data() + ch;
+            for (size_t i = 0; i < frames; i++) {
+                dst[i * mw.channels] = src[i];
+            }
         }
+        const sf_count_t n = sf_write_float(snd, interleaved.data(), frames * mw.channels);
+        written += n;
+        if (n != (sf_count_t)(frames * mw.channels)) break;
     }
+    std::cout << "Wrote " << written << " samples (expected " << expected << ")\n";
 
-    std::cout << "Writing to file...\n";
-    sf_count_t written = sf_write_float(snd, interleaved.data(), interleaved.size());
-    std::cout << "Wrote " << written << " samples (expected " << interleaved.size() << ")\n";
-    
-    if (written != (sf_count_t)interleaved.size()) {
+    if (written != (sf_count_t)expected) {
         std::cerr << "Write error: " << sf_strerror(snd) << "\n";
     }
-    
+
     sf_close(snd);
     std::cout << "File closed\n";
 }